@@ -35,38 +35,44 @@ class PTBIncomingAdapter:
             If a particular field is not present in the PTB update, the
             corresponding domain field will be set to None.
         """
+        # Every PTB attribute access goes through a property, so each
+        # object is read once and reused below.
         user = None
-        if update.effective_user:
+        ptb_user = update.effective_user
+        if ptb_user:
             user = EffectiveUser(
-                id=update.effective_user.id,
-                first_name=update.effective_user.first_name,
-                username=update.effective_user.username,
+                id=ptb_user.id,
+                first_name=ptb_user.first_name,
+                username=ptb_user.username,
             )
         chat = None
-        if update.effective_chat:
+        ptb_chat = update.effective_chat
+        if ptb_chat:
             chat = EffectiveChat(
-                id=update.effective_chat.id,
-                type=update.effective_chat.type,
+                id=ptb_chat.id,
+                type=ptb_chat.type,
             )
         message = None
-        if update.effective_message:
+        ptb_message = update.effective_message
+        if ptb_message:
             message = EffectiveMessage(
-                message_id=update.effective_message.message_id,
-                chat_id=update.effective_message.chat_id,
-                date=update.effective_message.date,
-                text=update.effective_message.text,
+                message_id=ptb_message.message_id,
+                chat_id=ptb_message.chat_id,
+                date=ptb_message.date,
+                text=ptb_message.text,
             )
         callback_query = None
-        if update.callback_query:
+        ptb_query = update.callback_query
+        if ptb_query:
             message_id: int | None = None
             chat_id: int | None = None
-            if update.callback_query.message:
-                message_id = update.callback_query.message.message_id
-                chat_id = update.callback_query.message.chat.id
+            if ptb_query.message:
+                message_id = ptb_query.message.message_id
+                chat_id = ptb_query.message.chat.id
             callback_query = CallbackQuery(
-                id=update.callback_query.id,
-                data=update.callback_query.data,
-                user_id=update.callback_query.from_user.id,
+                id=ptb_query.id,
+                data=ptb_query.data,
+                user_id=ptb_query.from_user.id,
                 message_id=message_id,
                 chat_id=chat_id,
             )
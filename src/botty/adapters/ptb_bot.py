@@ -1,3 +1,6 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from loguru import logger
 from telegram import Bot
 from telegram import Message as TGMessage
@@ -23,6 +26,27 @@ from ..responses import (
 )
 
 
+# PTB Bot method used to send each answer type; None means send() does not
+# deliver it (EmptyAnswer sends nothing, EditAnswer goes through edit()).
+_SEND_METHODS: dict[type[BaseAnswer], str | None] = {
+    Answer: "send_message",
+    PhotoAnswer: "send_photo",
+    DocumentAnswer: "send_document",
+    AudioAnswer: "send_audio",
+    VideoAnswer: "send_video",
+    VoiceAnswer: "send_voice",
+    LocationAnswer: "send_location",
+    VenueAnswer: "send_venue",
+    ContactAnswer: "send_contact",
+    PollAnswer: "send_poll",
+    DiceAnswer: "send_dice",
+    EmptyAnswer: None,
+    EditAnswer: None,
+}
+
+_UNKNOWN = object()
+
+
 class PTBBotAdapter(TelegramBotClient):
     """Concrete implementation of TelegramBotClient using python-telegram-bot's Bot.
 
@@ -37,6 +61,21 @@ class PTBBotAdapter(TelegramBotClient):
             bot: The PTB Bot instance used for sending and editing messages.
         """
         self._bot = bot
+        # Answer type -> bound PTB send method, or None for answers this
+        # method does not send. Looked up by exact type; subclasses are
+        # resolved through their MRO once and then cached here too.
+        self._senders: dict[type, Callable[..., Awaitable[TGMessage]] | None] = {
+            cls: None if name is None else getattr(bot, name)
+            for cls, name in _SEND_METHODS.items()
+        }
+
+    def _find_sender(self, answer_type: type) -> Any:
+        for cls in answer_type.__mro__[1:]:
+            if cls in _SEND_METHODS:
+                sender = self._senders[cls]
+                self._senders[answer_type] = sender
+                return sender
+        return _UNKNOWN
 
     async def send(self, chat_id: int, answer: BaseAnswer) -> Message | None:
         """Send a message to a chat using the appropriate PTB method based on answer type.
@@ -49,59 +88,19 @@ class PTBBotAdapter(TelegramBotClient):
             A domain Message object if a message was sent, or None if the
             answer was EmptyAnswer or EditAnswer (which is handled separately) or answer type not known.
         """
-
-        message: TGMessage
-        match answer:
-            case Answer():
-                message = await self._bot.send_message(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case PhotoAnswer():
-                message = await self._bot.send_photo(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case DocumentAnswer():
-                message = await self._bot.send_document(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case AudioAnswer():
-                message = await self._bot.send_audio(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case VideoAnswer():
-                message = await self._bot.send_video(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case VoiceAnswer():
-                message = await self._bot.send_voice(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case LocationAnswer():
-                message = await self._bot.send_location(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case VenueAnswer():
-                message = await self._bot.send_venue(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case ContactAnswer():
-                message = await self._bot.send_contact(
-                    chat_id=chat_id, **answer.to_dict()
-                )
-            case PollAnswer():
-                message = await self._bot.send_poll(chat_id=chat_id, **answer.to_dict())
-            case DiceAnswer():
-                message = await self._bot.send_dice(chat_id=chat_id, **answer.to_dict())
-            case EmptyAnswer():
-                return None
-            case EditAnswer():
-                return None
-            case _:
+        try:
+            sender = self._senders[type(answer)]
+        except KeyError:
+            sender = self._find_sender(type(answer))
+            if sender is _UNKNOWN:
                 logger.warning(
                     f"Received unknown message type: {type(answer)} in message {answer.message_key}"
                 )
                 return None
+        if sender is None:
+            return None
 
+        message: TGMessage = await sender(chat_id=chat_id, **answer.to_dict())
         return Message.from_telegram(message)
 
     async def edit(
@@ -129,12 +128,13 @@ class PTBBotAdapter(TelegramBotClient):
             raise BottyError(
                 f"Edit received answer of type: {type(answer)}"
             )  # TODO: make custom exception
+        payload = answer.to_dict()
         if message_id is None:
-            message = await self._bot.send_message(chat_id=chat_id, **answer.to_dict())
+            message = await self._bot.send_message(chat_id=chat_id, **payload)
             return Message.from_telegram(message)
         try:
             result = await self._bot.edit_message_text(
-                chat_id=chat_id, message_id=message_id, **answer.to_dict()
+                chat_id=chat_id, message_id=message_id, **payload
             )
 
             if not result:
@@ -142,6 +142,6 @@ class PTBBotAdapter(TelegramBotClient):
         except Exception as e:
             logger.exception(f"Failed to edit message {message_id}: {e}")
             # Fall back to sending new message
-            message = await self._bot.send_message(chat_id=chat_id, **answer.to_dict())
+            message = await self._bot.send_message(chat_id=chat_id, **payload)
             logger.debug(f"Sent new message {message.message_id} after edit failed")
             return Message.from_telegram(message)
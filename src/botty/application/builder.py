@@ -32,6 +32,7 @@ class AppBuilder:
         self._routers: list[Router] = []
         self._database_provider: DatabaseProvider | None = None
         self._discovery: bool = True
+        self._concurrent_updates: bool | int = False
 
     def token(self, token: str) -> Self:
         """Set the bot token obtained from @BotFather.
@@ -108,6 +109,24 @@ class AppBuilder:
         self._discovery = False
         return self
 
+    def concurrent_updates(self, limit: bool | int = True) -> Self:
+        """Process updates from different chats concurrently.
+
+        By default updates are handled one after another, so a slow handler
+        in one chat delays every other chat. With concurrency enabled, a
+        slow chat only delays itself: updates from the same chat are still
+        handled one at a time and in order.
+
+        Args:
+            limit: True for PTB's default limit, or the maximum number of
+                   updates processed at once.
+
+        Returns:
+            The builder instance for chaining.
+        """
+        self._concurrent_updates = limit
+        return self
+
     def build(self) -> Application:
         """Construct the Application instance with the configured settings.
 
@@ -129,4 +148,9 @@ class AppBuilder:
             )
         if self._discovery:
             self._routers.extend(discover_routers(self._handlers_dir))
-        return Application(self._token, self._database_provider, self._routers)
+        return Application(
+            self._token,
+            self._database_provider,
+            self._routers,
+            concurrent_updates=self._concurrent_updates,
+        )
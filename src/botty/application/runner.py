@@ -25,6 +25,7 @@ class Application:
         token: str,
         database_provider: DatabaseProvider | None,
         routers: list[Router],
+        concurrent_updates: bool | int = False,
     ):
         """Initialize the application and register all handlers.
 
@@ -32,13 +33,20 @@ class Application:
             token: The Telegram bot token from @BotFather.
             database_provider: Optional database provider.
             routers: List of Router instances.
+            concurrent_updates: Passed to PTB's `concurrent_updates`. True (or
+                                a number of updates) lets updates from
+                                different chats run concurrently; updates
+                                from one chat are still handled in order.
         """
         context_types = ContextTypes(
             context=Context, bot_data=BotData, chat_data=ChatData, user_data=UserData
         )
+        builder = PTBApplicationBuilder().token(token).context_types(context_types)
+        if concurrent_updates:
+            builder = builder.concurrent_updates(concurrent_updates)
         self.application: PTBApplication[
             ExtBot, Context, UserData, ChatData, BotData, None
-        ] = PTBApplicationBuilder().token(token).context_types(context_types).build()
+        ] = builder.build()
         self.application.bot_data.message_registry = MessageRegistry()
         self.application.bot_data.database_provider = database_provider
         self.application.bot_data.dependency_container = DependencyContainer()
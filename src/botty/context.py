@@ -1,4 +1,7 @@
+import asyncio
 from typing import TYPE_CHECKING, Protocol
+from weakref import WeakValueDictionary
+
 from telegram.ext import CallbackContext, ExtBot, Application as TgApplication
 
 
@@ -17,12 +20,16 @@ class BotData:
         dependency_container: Container for dependency injection.
         database_provider: Optional database provider instance.
         bot_client: Client for sending/editing messages (adapter).
+        chat_locks: Per-chat locks that keep each chat's updates in order
+                    when updates are processed concurrently. Entries
+                    disappear once no update for that chat is in flight.
     """
 
     message_registry: "MessageRegistry"
     dependency_container: "DependencyContainer"
     database_provider: "DatabaseProvider | None"
     bot_client: "TelegramBotClient"
+    chat_locks: "WeakValueDictionary[int, asyncio.Lock]"
 
     def __init__(self):
         # TODO: add error when not properly initialized
@@ -30,6 +37,7 @@ class BotData:
         self.dependency_container = None  # type: ignore [invalid-assignment]
         self.database_provider = None
         self.bot_client = None  # type: ignore [invalid-assignment]
+        self.chat_locks = WeakValueDictionary()
 
 
 class UserData:
@@ -1,6 +1,7 @@
+import asyncio
 import inspect
 from collections.abc import Callable
-from typing import Any, Type
+from typing import Any, Literal, Type, TypeAlias
 
 from sqlmodel import Session
 
@@ -9,7 +10,11 @@ from ..domain import BaseRepository, BaseService, Update
 from ..exceptions import DependencyResolutionError
 from .markers import Dependency, Depends
 from .scope import RequestScope
-from .utils import _extract_depends
+from .utils import _get_plan
+
+InjectKind: TypeAlias = Literal["service", "repository", "none"]
+
+_MISSING = object()
 
 
 class DependencyContainer:
@@ -31,32 +36,65 @@ class DependencyContainer:
 
     def __init__(self):
         self._singletons: dict[Dependency, Any] = {}
+        self._process_cache: dict[Dependency, Any] = {}
+        self._process_locks: dict[Dependency, asyncio.Lock] = {}
+        # Whether an annotation is a service, a repository or neither never
+        # changes, so it is worked out once per type instead of walking the
+        # MRO on every injection.
+        self._inject_kinds: dict[Any, InjectKind] = {}
 
     def reset(self):
-        """Clear all cached singleton instances.
+        """Clear all cached singleton instances and process-scoped values.
 
         Useful for testing to ensure a clean state.
         """
         self._singletons = dict()
+        self._process_cache = dict()
+        self._process_locks = dict()
+
+    def invalidate_process_cache(self, dep: Depends | Dependency | None = None):
+        """Drop cached process-scoped dependency values.
+
+        The next request that needs the dependency recomputes it.
+
+        Args:
+            dep: The Depends marker (or its dependency callable) to invalidate.
+                 If None, every process-scoped value is dropped.
+        """
+        if dep is None:
+            self._process_cache.clear()
+            return
+        if isinstance(dep, Depends):
+            dep = dep.dependency
+        self._process_cache.pop(dep, None)
 
     async def resolve_dependency(
-        self, dep: Depends, scope: RequestScope, dependency_chain: list[str]
+        self, dep: Depends, request_scope: RequestScope, dependency_chain: list[str]
     ) -> Any:
         """Resolve a single dependency marked with Depends.
 
-        This method handles caching (if use_cache is True) and delegates
-        to _call_dependency to invoke the dependency function.
+        This method handles caching (per request if use_cache is True, or
+        for the whole process if scope is "process") and delegates to
+        _call_dependency to invoke the dependency function.
+
+        Process-scoped values outlive the request that computed them, so a
+        process-scoped dependency must not read the Update, the Context or
+        the request's Session, either directly or through a repository or
+        a request-scoped sub-dependency. The first computation is guarded
+        by a per-dependency lock, so concurrent first requests compute the
+        value once.
 
         Args:
             dep: The Depends marker containing the dependency callable/class.
-            scope: Current request scope (provides session, cache, etc.).
+            request_scope: Current request scope (provides session, cache, etc.).
             dependency_chain: List of names for error tracing (mutable).
 
         Returns:
             The resolved dependency value.
 
         Raises:
-            DependencyResolutionError: If the dependency cannot be resolved.
+            DependencyResolutionError: If the dependency cannot be resolved,
+                or if a process-scoped dependency reads per-request data.
         """
         if dep.dependency is None:
             raise DependencyResolutionError(
@@ -64,19 +102,38 @@ class DependencyContainer:
                 suggestion="check that you use Annotated[YourRepository, Depends(get_your_repository)] annotation",
             )
 
-        # Check cache if enabled
-        scoped = scope.get_dependency(dep)
-        if dep.use_cache and scoped is not None:
-            return scoped
-
-        # Resolve the dependency
-        result = await self._call_dependency(dep.dependency, scope, dependency_chain)
+        if dep.scope == "process":
+            # Overrides registered on the scope (see TestRequestScope) take
+            # precedence over the shared value.
+            overridden = request_scope.get_dependency(dep)
+            if overridden is not None:
+                return overridden
+            result = self._process_cache.get(dep.dependency, _MISSING)
+            if result is not _MISSING:
+                return result
+            self._check_process_safe(dep.dependency, dependency_chain)
+            lock = self._process_locks.setdefault(dep.dependency, asyncio.Lock())
+            async with lock:
+                # Another request may have computed it while we waited.
+                result = self._process_cache.get(dep.dependency, _MISSING)
+                if result is _MISSING:
+                    result = await self._call_dependency(
+                        dep.dependency, request_scope, dependency_chain
+                    )
+                    self._process_cache[dep.dependency] = result
+            return result
 
-        # Cache if enabled
         if dep.use_cache:
-            scope.cache_dependency(dep.dependency, result)
+            return await request_scope.get_or_set(
+                dep.dependency,
+                lambda: self._call_dependency(
+                    dep.dependency, request_scope, dependency_chain
+                ),
+            )
 
-        return result
+        return await self._call_dependency(
+            dep.dependency, request_scope, dependency_chain
+        )
 
     def singleton(self, cls: Dependency) -> Any:
         """Retrieve or create a singleton instance of a class.
@@ -87,36 +144,35 @@ class DependencyContainer:
         Returns:
             The singleton instance.
         """
-        if cls not in self._singletons:
-            self._singletons[cls] = cls()
-        return self._singletons[cls]
+        try:
+            return self._singletons[cls]
+        except KeyError:
+            instance = self._singletons[cls] = cls()
+            return instance
 
     async def _call_dependency(
         self, dependency: Callable, scope: RequestScope, dependency_chain: list[str]
     ) -> Any:
         """Call a dependency function, resolving its dependencies recursively."""
-        sig = inspect.signature(dependency)
-        type_hints = inspect.get_annotations(dependency)
-
         # Prepare arguments
         dep_args = {}
-        for param_name, param in sig.parameters.items():
-            annotation = type_hints.get(param_name, param.annotation)
-
-            dep = _extract_depends(annotation)
-            if dep is not None:
+        for action in _get_plan(dependency):
+            kind = action.kind
+            if kind == "depends":
+                dep = action.payload
                 dep_name = getattr(dep.dependency, "__name__", str(dep.dependency))
                 dependency_chain.append(dep_name)
-                dep_args[param_name] = await self.resolve_dependency(
+                dep_args[action.name] = await self.resolve_dependency(
                     dep, scope, dependency_chain
                 )
-                continue
-
-            if annotation != inspect.Parameter.empty:
-                injected = self._inject_basic_dependencies(annotation, scope)
+            elif kind == "update":
+                dep_args[action.name] = scope.update
+            elif kind == "context":
+                dep_args[action.name] = scope.context
+            elif action.payload is not inspect.Parameter.empty:
+                injected = self._inject_basic_dependencies(action.payload, scope)
                 if injected is not None:
-                    dep_args[param_name] = injected
-                    continue
+                    dep_args[action.name] = injected
 
         # Call the dependency
         if inspect.iscoroutinefunction(dependency):
@@ -124,17 +180,61 @@ class DependencyContainer:
         else:
             return dependency(**dep_args)
 
+    def _check_process_safe(
+        self, dependency: Callable, dependency_chain: list[str]
+    ) -> None:
+        """Reject a process-scoped dependency that reads per-request data."""
+        for action in _get_plan(dependency):
+            if action.kind == "depends":
+                # Process-scoped sub-dependencies are checked when resolved.
+                if action.payload.scope != "process":
+                    self._check_process_safe(
+                        action.payload.dependency, dependency_chain
+                    )
+            elif (
+                action.kind == "update"
+                or action.kind == "context"
+                or action.payload is Session
+                or _classify_injectable(action.payload) == "repository"
+            ):
+                raise DependencyResolutionError(
+                    message=(
+                        f"Process-scoped dependency reads per-request data "
+                        f"through parameter '{action.name}' of "
+                        f"'{getattr(dependency, '__name__', dependency)}'"
+                    ),
+                    dependency_chain=dependency_chain,
+                    suggestion=(
+                        'Use the default scope="request" for dependencies '
+                        "that read the update, the context or the database."
+                    ),
+                )
+
     def _inject_basic_dependencies(self, type_hint: Type, scope: RequestScope) -> Any:
         """Inject basic dependencies based on type annotation."""
-        if type_hint in self._BASIC_DEPENDENCIES:
-            return self._BASIC_DEPENDENCIES[type_hint](scope)
+        basic = self._BASIC_DEPENDENCIES.get(type_hint)
+        if basic is not None:
+            return basic(scope)
+
+        kind = self._inject_kinds.get(type_hint)
+        if kind is None:
+            kind = self._inject_kinds[type_hint] = _classify_injectable(type_hint)
 
         # Singleton services
-        if hasattr(type_hint, "__mro__") and BaseService in type_hint.__mro__:
+        if kind == "service":
             return self.singleton(type_hint)
 
         # Repository classes (need session)
-        if hasattr(type_hint, "__mro__") and BaseRepository in type_hint.__mro__:
+        if kind == "repository":
             return type_hint(session=scope.session)
 
         return None
+
+
+def _classify_injectable(type_hint: Any) -> InjectKind:
+    if isinstance(type_hint, type):
+        if issubclass(type_hint, BaseService):
+            return "service"
+        if issubclass(type_hint, BaseRepository):
+            return "repository"
+    return "none"
@@ -1,7 +1,9 @@
 from collections.abc import Callable
-from typing import Type, TypeAlias
+from typing import Literal, Type, TypeAlias
+from weakref import WeakValueDictionary
 
 Dependency: TypeAlias = Callable | Type
+DependencyScope: TypeAlias = Literal["request", "process"]
 
 
 class Depends:
@@ -16,6 +18,17 @@ class Depends:
         use_cache: If True (default), the result is cached within the same
                    request scope. If False, the dependency is recomputed
                    every time it is requested.
+        scope: "request" (default) caches the result per request (see
+               use_cache). "process" computes the result once and shares it
+               across all requests until it is invalidated with
+               `DependencyContainer.invalidate_process_cache`. Process-scoped
+               values are used concurrently by many handlers, so they must be
+               safe to share (settings, HTTP clients, etc.). They must not
+               read the Update, the Context or the request's Session, even
+               through a request-scoped sub-dependency such as
+               `InjectableUser`; resolving one that does raises
+               DependencyResolutionError. Concurrent first requests wait
+               for a single computation.
 
     Example:
         ```python
@@ -23,9 +36,44 @@ class Depends:
             ...
 
         CurrentUser = Annotated[User, Depends(get_current_user)]
+        Settings = Annotated[AppSettings, Depends(load_settings, scope="process")]
         ```
+
+    Markers are canonical: `Depends(f)` returns the same object every time it
+    is called with the same arguments, so aliases declared in different
+    modules share one marker and compare by identity.
     """
 
-    def __init__(self, dependency: Dependency, *, use_cache: bool = True):
+    __slots__ = ("dependency", "use_cache", "scope", "__weakref__")
+
+    _instances: "WeakValueDictionary[tuple, Depends]" = WeakValueDictionary()
+
+    dependency: Dependency
+    use_cache: bool
+    scope: DependencyScope
+
+    def __new__(
+        cls,
+        dependency: Dependency,
+        *,
+        use_cache: bool = True,
+        scope: DependencyScope = "request",
+    ) -> "Depends":
+        key = (cls, dependency, use_cache, scope)
+        try:
+            cached = cls._instances.get(key)
+        except TypeError:
+            # Unhashable dependency (e.g. a callable instance defining __eq__
+            # without __hash__): nothing to share it with.
+            key = None
+            cached = None
+        if cached is not None:
+            return cached
+
+        self = super().__new__(cls)
         self.dependency = dependency
         self.use_cache = use_cache
+        self.scope = scope
+        if key is not None:
+            cls._instances[key] = self
+        return self
@@ -3,9 +3,10 @@ from typing import Any
 
 from ..exceptions import DatabaseNotConfiguredError, DependencyResolutionError
 from .container import DependencyContainer
+from .markers import Depends
 from .scope import RequestScope
 from .types import Handler
-from .utils import _extract_depends
+from .utils import _get_plan
 
 
 class DependencyResolver:
@@ -15,6 +16,13 @@ class DependencyResolver:
     signature, identifies parameters that need injection (via Depends or
     basic types), and builds a dictionary of keyword arguments to call the
     handler with.
+
+    How each parameter is filled in is worked out once per handler and
+    cached, so an update only walks a precomputed plan.
+
+    Parameters marked with Depends are resolved one after another, in
+    signature order, so a request-cached dependency shared between them runs
+    once and a failure stops resolution before later dependencies start.
     """
 
     def __init__(self, container: DependencyContainer):
@@ -26,6 +34,45 @@ class DependencyResolver:
         """
         self.container: DependencyContainer = container
 
+    @staticmethod
+    def prepare(handler: Handler) -> None:
+        """Plan a handler's parameters ahead of its first update.
+
+        Called by the Router decorators, so the introspection happens at
+        import time instead of while handling a request.
+
+        Args:
+            handler: The handler function to plan.
+        """
+        _get_plan(handler)
+
+    def resolve_from_scope(
+        self, handler: Handler, scope: RequestScope
+    ) -> dict[str, Any] | None:
+        """Resolve a handler that only takes the update and the context.
+
+        Such handlers need no dependency resolution at all, so their
+        arguments are taken straight from the scope without awaiting
+        anything.
+
+        Args:
+            handler: The handler function to resolve.
+            scope: The current request scope.
+
+        Returns:
+            The keyword arguments for the handler, or None if it has other
+            parameters and must go through `resolve_handler`.
+        """
+        kwargs = {}
+        for action in _get_plan(handler):
+            if action.kind == "update":
+                kwargs[action.name] = scope.update
+            elif action.kind == "context":
+                kwargs[action.name] = scope.context
+            else:
+                return None
+        return kwargs
+
     async def resolve_handler(
         self, handler: Handler, scope: RequestScope
     ) -> dict[str, Any]:
@@ -44,63 +91,75 @@ class DependencyResolver:
                                        or if a required database dependency
                                        is requested but no provider is set.
         """
-        sig = inspect.signature(handler)
-        type_hints = inspect.get_annotations(handler)
-
         kwargs = {}
         handler_name = handler.__name__
 
-        for param_name, param in sig.parameters.items():
-            annotation = type_hints.get(param_name)
-
-            dep = _extract_depends(annotation)
-            if dep is None:
-                if annotation is not None:
-                    try:
-                        injected = self.container._inject_basic_dependencies(
-                            annotation, scope
-                        )
-                        if injected is not None:
-                            kwargs[param_name] = injected
-                            continue
-                    except DatabaseNotConfiguredError as e:
-                        raise DependencyResolutionError(
-                            message=f"{e.message} (handler '{handler_name}', parameter '{param_name}')",
-                            dependency_chain=[handler_name, param_name],
-                            parameter_name=param_name,
-                            handler_name=handler_name,
-                        ) from e
-
-                raise DependencyResolutionError(
-                    message=(
-                        "Annotation does not contain Depends\n"
-                        f"Parameter '{param_name}' of handler '{handler_name}' has no dependency information.\n"
-                        "Either:\n"
-                        "  - Use Annotated[T, Depends(...)] for injectable parameters, or\n"
-                        "  - Remove the parameter if it is not needed."
-                    ),
-                    dependency_chain=[handler_name, param_name],
-                    handler_name=handler_name,
-                    parameter_name=param_name,
-                    suggestion=(
-                        "Example: async def handler(..., repo: Annotated[UserRepo, Depends(get_repo)]):"
-                    ),
+        for action in _get_plan(handler):
+            kind = action.kind
+            if kind == "update":
+                kwargs[action.name] = scope.update
+            elif kind == "context":
+                kwargs[action.name] = scope.context
+            elif kind == "depends":
+                kwargs[action.name] = await self._resolve_parameter(
+                    action.payload, scope, handler_name, action.name
+                )
+            else:
+                kwargs[action.name] = self._inject_parameter(
+                    action.payload, scope, handler_name, action.name
                 )
 
-            dependency_chain = [handler_name, param_name]
+        return kwargs
+
+    def _inject_parameter(
+        self, annotation: Any, scope: RequestScope, handler_name: str, param_name: str
+    ) -> Any:
+        """Inject a parameter without Depends from its type annotation."""
+        if annotation is not inspect.Parameter.empty:
             try:
-                kwargs[param_name] = await self.container.resolve_dependency(
-                    dep, scope, dependency_chain
-                )
-            except DependencyResolutionError:
-                raise
-            except Exception as e:
+                injected = self.container._inject_basic_dependencies(annotation, scope)
+                if injected is not None:
+                    return injected
+            except DatabaseNotConfiguredError as e:
                 raise DependencyResolutionError(
-                    message=f"Failed to resolve dependency: {e}",
-                    dependency_chain=dependency_chain,
+                    message=f"{e.message} (handler '{handler_name}', parameter '{param_name}')",
+                    dependency_chain=(handler_name, param_name),
                     parameter_name=param_name,
                     handler_name=handler_name,
-                    suggestion="Check that all required dependencies are registered.",
                 ) from e
 
-        return kwargs
+        raise DependencyResolutionError(
+            message=(
+                "Annotation does not contain Depends\n"
+                f"Parameter '{param_name}' of handler '{handler_name}' has no dependency information.\n"
+                "Either:\n"
+                "  - Use Annotated[T, Depends(...)] for injectable parameters, or\n"
+                "  - Remove the parameter if it is not needed."
+            ),
+            dependency_chain=(handler_name, param_name),
+            handler_name=handler_name,
+            parameter_name=param_name,
+            suggestion=(
+                "Example: async def handler(..., repo: Annotated[UserRepo, Depends(get_repo)]):"
+            ),
+        )
+
+    async def _resolve_parameter(
+        self, dep: Depends, scope: RequestScope, handler_name: str, param_name: str
+    ) -> Any:
+        """Resolve one Depends parameter, wrapping failures with handler context."""
+        # The container appends nested dependency names to this list, so it
+        # has to exist before the call to produce a useful error trail.
+        dependency_chain = [handler_name, param_name]
+        try:
+            return await self.container.resolve_dependency(dep, scope, dependency_chain)
+        except DependencyResolutionError:
+            raise
+        except Exception as e:
+            raise DependencyResolutionError(
+                message=f"Failed to resolve dependency: {e}",
+                dependency_chain=dependency_chain,
+                parameter_name=param_name,
+                handler_name=handler_name,
+                suggestion="Check that all required dependencies are registered.",
+            ) from e
@@ -1,3 +1,4 @@
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from sqlmodel import Session
@@ -24,6 +25,15 @@ class RequestScope:
         cache: Dict storing cached dependency results.
     """
 
+    __slots__ = (
+        "update",
+        "context",
+        "cache",
+        "_session",
+        "_session_closed",
+        "_provider",
+    )
+
     def __init__(self, update: Update, context: ContextProtocol):
         """Initialize the scope with update and context.
 
@@ -52,11 +62,13 @@ class RequestScope:
         Raises:
             DatabaseNotConfiguredError: If no database provider was set.
         """
+        session = self._session
+        if session is not None:
+            return session
         if self._provider is None:
             raise DatabaseNotConfiguredError(dependency_name="Session")
-        if self._session is None:
-            self._session = self._provider.get_session()
-        return self._session
+        session = self._session = self._provider.get_session()
+        return session
 
     def close(self):
         """Close session if it was created."""
@@ -89,6 +101,27 @@ class RequestScope:
         """
         self.cache[cls] = dependency
 
+    async def get_or_set(
+        self, key: Dependency, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for a key, computing and caching it if absent.
+
+        Unlike `get_dependency`, a cached None is returned as is instead of
+        being recomputed.
+
+        Args:
+            key: The dependency class/callable used as key.
+            factory: Called without arguments to produce the value on a miss.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        try:
+            return self.cache[key]
+        except KeyError:
+            value = self.cache[key] = await factory()
+            return value
+
     def commit(self):
         """Commit the current transaction if a session exists."""
         if self._session:
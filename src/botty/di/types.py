@@ -1,5 +1,5 @@
 from collections.abc import AsyncGenerator
-from typing import Any, Protocol, TypeAlias, runtime_checkable
+from typing import Any, Protocol, TypeAlias
 
 from ..context import ContextProtocol
 from ..domain import Update
@@ -13,10 +13,12 @@ Handlers must be async generators that yield BaseAnswer objects (or subclasses).
 """
 
 
-@runtime_checkable
 class HandlerProtocol(Protocol):
     """Protocol defining the signature of a valid handler.
 
+    This protocol is for static type checking only. Handlers are checked at
+    runtime once, at registration, by `validate_handler`.
+
     Handlers must be async generators that accept at least two positional
     arguments (update and context) and may accept additional injected
     dependencies via keyword arguments.
@@ -1,12 +1,152 @@
-from typing import Annotated, get_args, get_origin
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Annotated, Any, Literal, TypeAlias, get_origin
+from weakref import WeakKeyDictionary
 
+from ..context import Context, ContextProtocol
+from ..domain import Update
 from .markers import Depends
 
+Parameters = tuple[tuple[str, Any], ...]
+
+_VARIADIC = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+# Handlers and dependency callables are defined once at import time, so their
+# parameter lists can be introspected once and shared by every request.
+_PARAMETERS_CACHE: WeakKeyDictionary[Callable, Parameters] = WeakKeyDictionary()
+
 
 def _extract_depends(annotation):
-    if get_origin(annotation) is Annotated:
-        _, *metadata = get_args(annotation)
-        for meta in metadata:
-            if isinstance(meta, Depends):
-                return meta
+    # Most parameters are plain classes; return early for them and read
+    # __metadata__ directly instead of building get_args() for the rest.
+    if get_origin(annotation) is not Annotated:
+        return None
+    for meta in annotation.__metadata__:
+        if isinstance(meta, Depends):
+            return meta
     return None
+
+
+def _get_parameters(func: Callable) -> Parameters:
+    """Return (name, annotation) pairs for the parameters of a callable.
+
+    Results are cached per callable. Parameters without an annotation are
+    reported with `inspect.Parameter.empty`. Variadic parameters (*args,
+    **kwargs) are never injected and are left out.
+    """
+    try:
+        return _PARAMETERS_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    parameters = _introspect_parameters(func)
+    if any(isinstance(annotation, str) for _, annotation in parameters):
+        parameters = _resolve_string_annotations(func, parameters)
+
+    try:
+        _PARAMETERS_CACHE[func] = parameters
+    except TypeError:
+        pass  # not weak-referenceable, introspect again next time
+    return parameters
+
+
+def _introspect_parameters(func: Callable) -> Parameters:
+    code = getattr(func, "__code__", None)
+    if code is None or inspect.ismethod(func) or hasattr(func, "__wrapped__"):
+        # Classes, partials, bound methods and decorated callables need the
+        # full signature machinery to get the parameters right.
+        sig = inspect.signature(func)
+        annotations = inspect.get_annotations(func)
+        return tuple(
+            (name, annotations.get(name, param.annotation))
+            for name, param in sig.parameters.items()
+            if param.kind not in _VARIADIC
+        )
+
+    # Plain functions: read the argument names straight from the code object,
+    # which is much cheaper than building a Signature.
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    annotations = func.__annotations__
+    return tuple(
+        (name, annotations.get(name, inspect.Parameter.empty)) for name in names
+    )
+
+
+def _resolve_string_annotations(func: Callable, parameters: Parameters) -> Parameters:
+    """Evaluate postponed (string) annotations, keeping Annotated metadata.
+
+    Done once per callable, so modules using `from __future__ import
+    annotations` do not pay for evaluation on every request. Annotations that
+    cannot be evaluated are left as strings.
+    """
+    try:
+        signature = inspect.signature(func, eval_str=True)
+    except Exception:
+        return parameters
+    resolved = signature.parameters
+    return tuple(
+        (name, resolved[name].annotation if name in resolved else annotation)
+        for name, annotation in parameters
+    )
+
+
+ParamKind: TypeAlias = Literal["update", "context", "depends", "inject"]
+
+
+@dataclass(slots=True, frozen=True)
+class ParamAction:
+    """How one parameter of a handler or dependency is filled in.
+
+    Attributes:
+        name: Parameter name, used as the keyword argument.
+        kind: "update" and "context" are served from the request scope,
+              "depends" resolves the Depends marker in `payload`, and
+              "inject" injects by the type annotation in `payload`.
+        payload: The Depends marker or the annotation, depending on kind.
+    """
+
+    name: str
+    kind: ParamKind
+    payload: Any = None
+
+
+ResolutionPlan = tuple[ParamAction, ...]
+
+# Handlers and dependency callables do not change after import, so which of
+# their parameters are served from the scope, resolved through Depends, or
+# injected by type is decided once per callable instead of on every update.
+_PLAN_CACHE: WeakKeyDictionary[Callable, ResolutionPlan] = WeakKeyDictionary()
+
+
+def _plan_parameter(name: str, annotation: Any) -> ParamAction:
+    if annotation is Update:
+        return ParamAction(name, "update")
+    if annotation is Context or annotation is ContextProtocol:
+        return ParamAction(name, "context")
+    dep = _extract_depends(annotation)
+    if dep is not None:
+        return ParamAction(name, "depends", dep)
+    return ParamAction(name, "inject", annotation)
+
+
+def _get_plan(func: Callable) -> ResolutionPlan:
+    """Return the cached parameter actions for a callable.
+
+    Handlers are planned when they are registered with a Router (see
+    DependencyResolver.prepare) rather than on their first update.
+    """
+    try:
+        return _PLAN_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    plan = tuple(
+        _plan_parameter(name, annotation) for name, annotation in _get_parameters(func)
+    )
+
+    try:
+        _PLAN_CACHE[func] = plan
+    except TypeError:
+        pass  # not weak-referenceable, plan again next time
+    return plan
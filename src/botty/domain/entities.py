@@ -129,11 +129,15 @@ class Update:
         Raises:
             ChatIdNotFoundError: If no chat ID can be determined from any field.
         """
+        # `chat` comes from PTB's effective_chat, which already falls back
+        # through the message and callback query, so it settles nearly every
+        # update on the first check.
+        chat = self.chat
+        if chat is not None:
+            return chat.id
         if self.message:
             return self.message.chat_id
-        elif self.callback_query and self.callback_query.chat_id:
-            return self.callback_query.chat_id
-        elif self.chat:
-            return self.chat.id
-        else:
-            raise ChatIdNotFoundError()
+        callback_query = self.callback_query
+        if callback_query and callback_query.chat_id:
+            return callback_query.chat_id
+        raise ChatIdNotFoundError()
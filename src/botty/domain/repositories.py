@@ -85,14 +85,17 @@ class BaseRepository(ABC, Generic[T]):
                 original_error=e,
             ) from e
 
-    def create(self, entity: T) -> T:
+    def create(self, entity: T, *, refresh: bool = True) -> T:
         """Insert a new entity into the database.
 
         The entity is added to the session and flushed, and then refreshed
-        to obtain database-generated fields (e.g., auto-increment ID).
+        to obtain database-generated fields (e.g., server defaults).
 
         Args:
             entity: The entity instance to create.
+            refresh: If False, skip the extra SELECT issued by the refresh.
+                     The primary key is still populated by the flush; other
+                     database-generated fields are loaded lazily on access.
 
         Returns:
             The same entity with updated fields (e.g., ID populated).
@@ -103,7 +106,8 @@ class BaseRepository(ABC, Generic[T]):
         try:
             self.session.add(entity)
             self.session.flush()
-            self.session.refresh(entity)
+            if refresh:
+                self.session.refresh(entity)
             return entity
         except Exception as e:
             raise RepositoryOperationError(
@@ -112,13 +116,14 @@ class BaseRepository(ABC, Generic[T]):
                 original_error=e,
             ) from e
 
-    def update(self, entity: T) -> T:
+    def update(self, entity: T, *, refresh: bool = True) -> T:
         """Update an existing entity.
 
         Merges the entity into the session, flushes, and refreshes it.
 
         Args:
             entity: The entity with modified fields.
+            refresh: If False, skip the extra SELECT issued by the refresh.
 
         Returns:
             The updated entity (same instance, but refreshed).
@@ -129,7 +134,8 @@ class BaseRepository(ABC, Generic[T]):
         try:
             merged = self.session.merge(entity)
             self.session.flush()
-            self.session.refresh(merged)
+            if refresh:
+                self.session.refresh(merged)
             return merged
         except Exception as e:
             raise RepositoryOperationError(
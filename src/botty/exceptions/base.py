@@ -6,26 +6,62 @@ class BottyError(Exception):
 
     All custom botty exceptions inherit from this base class.
 
+    Many of these exceptions are raised and caught on hot paths without ever
+    being printed, so the full error text is only assembled when the
+    exception is converted to a string. Subclasses that carry structured
+    data override the `details` property instead of formatting it upfront.
+
+    Every class in the hierarchy declares `__slots__`, so instances never
+    materialise their `__dict__`; subclasses adding attributes must list
+    them in their own `__slots__`. `__reduce__` collects those slots, so
+    copies and pickles keep them.
+
     Attributes:
         message: The error message
         details: Optional additional details about the error
         suggestion: Optional suggestion for fixing the error
     """
 
+    __slots__ = ("message", "_details", "suggestion")
+
     def __init__(
         self, message: str, details: str | None = None, suggestion: str | None = None
     ):
         self.message: str = message
-        self.details: str | None = details
+        self._details: str | None = details
         self.suggestion: str | None = suggestion
 
-        error = message
+        super().__init__(message)
+
+    @property
+    def details(self) -> str | None:
+        """Additional details about the error, if any."""
+        return self._details
+
+    def __str__(self) -> str:
+        error = self.message
+        details = self.details
         if details:
             error += f"\n{details}"
-        if suggestion:
-            error += f"\n💡 Suggestion: {suggestion}"
+        if self.suggestion:
+            error += f"\n💡 Suggestion: {self.suggestion}"
+        return error
 
-        super().__init__(error)
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # BaseException.__reduce__ rebuilds from self.args and __dict__, which
+        # would lose the slot fields and call subclass __init__ with the
+        # wrong arguments. Bypass __init__ and restore every slot instead;
+        # BaseException.__setstate__ assigns them back with setattr.
+        state = {
+            name: getattr(self, name)
+            for klass in type(self).__mro__
+            for name in getattr(klass, "__slots__", ())
+            if hasattr(self, name)
+        }
+        return (_rebuild, (type(self), self.args), state)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert exception to dictionary for logging or serialization."""
@@ -35,3 +71,8 @@ class BottyError(Exception):
             "details": self.details,
             "suggestion": self.suggestion,
         }
+
+
+def _rebuild(cls: type[BottyError], args: tuple[Any, ...]) -> BottyError:
+    """Create an exception instance without running its `__init__`."""
+    return cls.__new__(cls, *args)
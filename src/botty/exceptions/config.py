@@ -3,3 +3,5 @@ from .base import BottyError
 
 class ConfigurationError(BottyError):
     """Error during app configuration"""
+
+    __slots__ = ()
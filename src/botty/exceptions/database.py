@@ -4,6 +4,8 @@ from .base import BottyError
 class DatabaseNotInitializedError(BottyError):
     """Raised when database engine is accessed before initialization."""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None):
         super().__init__(
             message or "Database engine is not initialized",
@@ -16,7 +18,10 @@ class DatabaseNotInitializedError(BottyError):
 class DatabaseNotConfiguredError(BottyError):
     """Raised when a database dependency is requested but no database provider is set."""
 
+    __slots__ = ("dependency_name",)
+
     def __init__(self, dependency_name: str):
+        self.dependency_name: str = dependency_name
         super().__init__(
             message=f"Cannot inject '{dependency_name}': no database provider configured.",
             suggestion=(
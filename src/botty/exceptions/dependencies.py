@@ -1,25 +1,40 @@
+from collections.abc import Sequence
+
 from .base import BottyError
 
 
 class DependencyResolutionError(BottyError):
     """Raise when dependency resolution fails"""
 
+    __slots__ = ("dependency_chain", "parameter_name", "handler_name")
+
     def __init__(
         self,
         message: str,
-        dependency_chain: list[str] | None = None,
+        dependency_chain: Sequence[str] | None = None,
         parameter_name: str | None = None,
         handler_name: str | None = None,
         suggestion: str | None = None,
     ):
-        self.dependency_chain: list[str] = dependency_chain or list()
+        # Snapshot as a tuple: callers keep appending to the list they pass
+        # while resolving, and the empty case shares the () singleton.
+        self.dependency_chain: tuple[str, ...] = (
+            tuple(dependency_chain) if dependency_chain else ()
+        )
+        self.parameter_name: str | None = parameter_name
+        self.handler_name: str | None = handler_name
 
-        details = []
-        if handler_name is not None:
-            details.append(f"Handler: {handler_name}")
-        if parameter_name is not None:
-            details.append(f"Parameter: {parameter_name}")
-        if len(self.dependency_chain) > 0:
-            details.append(f"Dependency chain: {' -> '.join(self.dependency_chain)}")
+        super().__init__(message, suggestion=suggestion)
 
-        super().__init__(message, "\n".join(details), suggestion)
+    @property
+    def details(self) -> str | None:
+        # Each present part is prefixed with a newline; the leading one is
+        # dropped on return.
+        details = ""
+        if self.handler_name is not None:
+            details += f"\nHandler: {self.handler_name}"
+        if self.parameter_name is not None:
+            details += f"\nParameter: {self.parameter_name}"
+        if self.dependency_chain:
+            details += f"\nDependency chain: {' -> '.join(self.dependency_chain)}"
+        return details[1:] or None
@@ -4,19 +4,25 @@ from .base import BottyError
 class HandlerDiscoveryError(BottyError):
     """Error during handler discovery"""
 
+    __slots__ = ()
+
 
 class InvalidHandlerError(BottyError):
     """Raised when a handler function doesn't match the expected signature."""
 
+    __slots__ = ("handler_name", "reason")
+
     def __init__(
         self,
         handler_name: str,
         reason: str,
         suggestion: str | None = None,
     ):
+        self.handler_name: str = handler_name
+        self.reason: str = reason
+
         super().__init__(
             message=f"Invalid handler '{handler_name}': {reason}",
-            details=f"Handler name: {handler_name}, reason: reason",
             suggestion=suggestion
             or "Check the handler documentation for correct signature",
         )
@@ -25,6 +31,8 @@ class InvalidHandlerError(BottyError):
 class EffectiveUserNotFound(BottyError):
     """Raised when update.effective_user is None"""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None):
         super().__init__(message=message or "Effective user was not found")
 
@@ -32,6 +40,8 @@ class EffectiveUserNotFound(BottyError):
 class EffectiveChatNotFound(BottyError):
     """Raised when update.effective_chat is None"""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None):
         super().__init__(message=message or "Effective chat was not found")
 
@@ -39,6 +49,8 @@ class EffectiveChatNotFound(BottyError):
 class EffectiveMessageNotFound(BottyError):
     """Raised when update.effective_message is None"""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None):
         super().__init__(message=message or "Effective message was not found")
 
@@ -46,6 +58,8 @@ class EffectiveMessageNotFound(BottyError):
 class CallbackQueryNotFound(BottyError):
     """Raised when update.callback_query is None"""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None):
         super().__init__(message=message or "Callback query was not found")
 
@@ -53,6 +67,8 @@ class CallbackQueryNotFound(BottyError):
 class EditedMessageNotFound(BottyError):
     """Raised when update.edited_message is None"""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None):
         super().__init__(message=message or "EditedMessage was not found")
 
@@ -60,6 +76,8 @@ class EditedMessageNotFound(BottyError):
 class PollNotFound(BottyError):
     """Raised when update.poll is None"""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None):
         super().__init__(message=message or "Poll was not found")
 
@@ -67,5 +85,7 @@ class PollNotFound(BottyError):
 class PollAnswerNotFound(BottyError):
     """Raised when update.poll_answer is None"""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None):
         super().__init__(message=message or "Poll answer was not found")
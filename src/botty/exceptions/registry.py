@@ -4,5 +4,7 @@ from .base import BottyError
 class ChatIdNotFoundError(BottyError):
     """Chat id couldn't be found"""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Couldn't find chat id in update data.")
@@ -4,6 +4,8 @@ from .base import BottyError
 class RepositoryOperationError(BottyError):
     """Error during database operation in repository"""
 
+    __slots__ = ("operation", "repository_name", "original_error")
+
     def __init__(
         self,
         operation: str,
@@ -11,12 +13,18 @@ class RepositoryOperationError(BottyError):
         original_error: Exception | None = None,
         message: str | None = None,
     ):
-        details = f"operation: {operation} repository_name: {repository_name}"
-        if original_error:
-            details += f"\n\noriginal_error:\n{original_error}"
+        self.operation: str = operation
+        self.repository_name: str = repository_name
+        self.original_error: Exception | None = original_error
 
         super().__init__(
             message
             or f"Repository operation '{operation}' failed in {repository_name}",
-            details=details,
         )
+
+    @property
+    def details(self) -> str | None:
+        details = f"operation: {self.operation} repository_name: {self.repository_name}"
+        if self.original_error:
+            details += f"\n\noriginal_error:\n{self.original_error}"
+        return details
@@ -4,13 +4,21 @@ from .base import BottyError
 class ResponseProcessingError(BottyError):
     """Raised when response processing fails."""
 
+    __slots__ = ("response_type", "handler_name")
+
     def __init__(
         self,
         message: str,
         response_type: str | None = None,
         handler_name: str | None = None,
     ):
-        super().__init__(
-            message,
-            details=f"Response type: {response_type}; Handler name: {handler_name}",
-        )
+        self.response_type: str | None = response_type
+        self.handler_name: str | None = handler_name
+
+        super().__init__(message)
+
+    @property
+    def details(self) -> str | None:
+        if self.response_type is None and self.handler_name is None:
+            return None
+        return f"Response type: {self.response_type}; Handler name: {self.handler_name}"
@@ -1,4 +1,6 @@
-from typing import Annotated, TypeAlias
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Annotated, Any, TypeAlias
 
 from .context import ContextProtocol
 from .di import Depends
@@ -13,6 +15,7 @@ from .domain import (
     Update,
 )
 from .exceptions import (
+    BottyError,
     CallbackQueryNotFound,
     EditedMessageNotFound,
     EffectiveChatNotFound,
@@ -23,10 +26,46 @@ from .exceptions import (
 )
 
 
-def _get_effective_user(update: Update, context: ContextProtocol) -> EffectiveUser:
-    if update.user is None:
-        raise EffectiveUserNotFound()
-    return update.user
+def _make_getter(
+    name: str, attr: str, error: type[BottyError]
+) -> Callable[[Update, ContextProtocol], Any]:
+    """Build an injector that returns `update.<attr>` or raises `error`.
+
+    Args:
+        name: Function name given to the injector; it shows up in
+            dependency chains and tracebacks.
+        attr: Name of the Update attribute to read.
+        error: Exception type raised when the attribute is None.
+
+    Returns:
+        A dependency function called `name`.
+    """
+
+    read = attrgetter(attr)
+
+    def getter(update: Update, context: ContextProtocol) -> Any:
+        value = read(update)
+        if value is None:
+            raise error()
+        return value
+
+    getter.__name__ = getter.__qualname__ = name
+    return getter
+
+
+_get_effective_user = _make_getter("_get_effective_user", "user", EffectiveUserNotFound)
+_get_effective_chat = _make_getter("_get_effective_chat", "chat", EffectiveChatNotFound)
+_get_effective_message = _make_getter(
+    "_get_effective_message", "message", EffectiveMessageNotFound
+)
+_get_callback_query = _make_getter(
+    "_get_callback_query", "callback_query", CallbackQueryNotFound
+)
+_get_edited_message = _make_getter(
+    "_get_edited_message", "edited_message", EditedMessageNotFound
+)
+_get_poll = _make_getter("_get_poll", "poll", PollNotFound)
+_get_poll_answer = _make_getter("_get_poll_answer", "poll_answer", PollAnswerNotFound)
 
 
 InjectableUser: TypeAlias = Annotated[EffectiveUser, Depends(_get_effective_user)]
@@ -43,12 +82,6 @@ Example:
 """
 
 
-def _get_effective_chat(update: Update, context: ContextProtocol) -> EffectiveChat:
-    if update.chat is None:
-        raise EffectiveChatNotFound()
-    return update.chat
-
-
 InjectableChat: TypeAlias = Annotated[EffectiveChat, Depends(_get_effective_chat)]
 """Type hint for injecting the effective chat.
 
@@ -63,14 +96,6 @@ Example:
 """
 
 
-def _get_effective_message(
-    update: Update, context: ContextProtocol
-) -> EffectiveMessage:
-    if update.message is None:
-        raise EffectiveMessageNotFound()
-    return update.message
-
-
 InjectableMessage: TypeAlias = Annotated[
     EffectiveMessage, Depends(_get_effective_message)
 ]
@@ -87,12 +112,6 @@ Example:
 """
 
 
-def _get_callback_query(update: Update, context: ContextProtocol) -> CallbackQuery:
-    if update.callback_query is None:
-        raise CallbackQueryNotFound()
-    return update.callback_query
-
-
 InjectableCallbackQuery: TypeAlias = Annotated[
     CallbackQuery, Depends(_get_callback_query)
 ]
@@ -109,12 +128,6 @@ Example:
 """
 
 
-def _get_edited_message(update: Update, context: ContextProtocol) -> EditedMessage:
-    if update.edited_message is None:
-        raise EditedMessageNotFound()
-    return update.edited_message
-
-
 InjectableEditedMessage: TypeAlias = Annotated[
     EditedMessage, Depends(_get_edited_message)
 ]
@@ -131,12 +144,6 @@ Example:
 """
 
 
-def _get_poll(update: Update, context: ContextProtocol) -> Poll:
-    if update.poll is None:
-        raise PollNotFound()
-    return update.poll
-
-
 InjectablePoll: TypeAlias = Annotated[Poll, Depends(_get_poll)]
 """Type hint for injecting the poll.
 
@@ -151,12 +158,6 @@ Example:
 """
 
 
-def _get_poll_answer(update: Update, context: ContextProtocol) -> PollAnswer:
-    if update.poll_answer is None:
-        raise PollAnswerNotFound()
-    return update.poll_answer
-
-
 InjectablePollAnswer: TypeAlias = Annotated[PollAnswer, Depends(_get_poll_answer)]
 """Type hint for injecting the poll answer.
 
@@ -173,11 +174,11 @@ Example:
 # TODO: support for inline queries
 
 __all__ = [
-    InjectableUser,
-    InjectableChat,
-    InjectableMessage,
-    InjectableCallbackQuery,
-    InjectableEditedMessage,
-    InjectablePoll,
-    InjectablePollAnswer,
+    "InjectableUser",
+    "InjectableChat",
+    "InjectableMessage",
+    "InjectableCallbackQuery",
+    "InjectableEditedMessage",
+    "InjectablePoll",
+    "InjectablePollAnswer",
 ]
@@ -22,6 +22,11 @@ class TelegramBotClient(Protocol):
         Returns:
             A domain Message object with details of the sent message,
             or None if nothing was sent (e.g., EmptyAnswer).
+
+        Note:
+            ResponseProcessor never passes EmptyAnswer here, but
+            implementations should still return None for it without doing
+            any work.
         """
         ...
 
@@ -1,11 +1,23 @@
 from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
 from telegram import ReplyKeyboardMarkup
 from telegram.constants import ParseMode
 
 
-@dataclass
-class BaseAnswer:
+class _PayloadCache:
+    """Slot for BaseAnswer's cached payload, kept out of the dataclass fields.
+
+    As a plain slot it does not show up in `fields()`, `asdict()`, `repr()`
+    or comparisons, and it exists on every subclass whether or not that
+    subclass is slotted itself.
+    """
+
+    __slots__ = ("_payload",)
+
+
+@dataclass(slots=True, frozen=True)
+class BaseAnswer(_PayloadCache):
     """Base class for all bot responses.
 
     All concrete response types inherit from this class. It contains common
@@ -21,6 +33,12 @@ class BaseAnswer:
         message_key: Optional key for later retrieval via MessageRegistry.
         metadata: Arbitrary additional data to store with the message.
         handler_name: Override the handler name used for registry tracking.
+
+    Answers are immutable; use `dataclasses.replace` to derive a modified
+    copy. The `metadata` dict itself can still be mutated in place.
+    Subclasses must be frozen dataclasses as well (`@dataclass(frozen=True)`,
+    optionally with `slots=True`); a plain `@dataclass` cannot inherit from
+    a frozen one.
     """
 
     text: str
@@ -34,20 +52,62 @@ class BaseAnswer:
     metadata: dict | None = field(default=None, kw_only=True)
     handler_name: str | None = field(default=None, kw_only=True)
 
-    @property
-    def type(self) -> str:
-        """Return the type of answer for routing."""
-        return self.__class__.__name__.lower()
+    # Payload keys, read from the attribute of the same name by
+    # _build_payload; optional ones are sent only when not None.
+    _REQUIRED_KEYS: ClassVar[tuple[str, ...]] = (
+        "text",
+        "disable_notification",
+        "protect_content",
+    )
+    _OPTIONAL_KEYS: ClassVar[tuple[str, ...]] = ("parse_mode", "reply_markup")
+    # Optional key that falls back to `text` when unset (caption, question).
+    _TEXT_FALLBACK_KEY: ClassVar[str | None] = None
+
+    # The type of answer for routing: the lowercased class name. Left
+    # unannotated on purpose: a ClassVar annotation would register with the
+    # dataclass machinery and reorder PollAnswer's own `type` field.
+    type = "baseanswer"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Explicit super(): slots=True replaces the class, so the zero-argument
+        # form would still point at the original one.
+        super(BaseAnswer, cls).__init_subclass__(**kwargs)
+        # Computed once per class instead of on every access. Subclasses that
+        # declare their own `type` field (PollAnswer), or inherit one from a
+        # dataclass base, keep it.
+        if (
+            "type" not in cls.__dict__
+            and "type" not in cls.__dict__.get("__annotations__", {})
+            and "type" not in getattr(cls, "__dataclass_fields__", {})
+        ):
+            cls.type = cls.__name__.lower()
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for telegram."""
-        result = {
-            "text": self.text,
-            "disable_notification": self.disable_notification,
-            "protect_content": self.protect_content,
-        }
-        if self.parse_mode:
-            result["parse_mode"] = self.parse_mode
-        if self.reply_markup:
-            result["reply_markup"] = self.reply_markup
+        """Convert to dictionary for telegram.
+
+        The payload is built once and cached on the instance, so sending the
+        same answer to many chats builds it only once. Callers get a fresh
+        copy they are free to modify.
+        """
+        # The slot stays unset until the first call; keeping the payload is
+        # safe because the instance is frozen.
+        try:
+            cached = self._payload
+        except AttributeError:
+            cached = self._build_payload()
+            object.__setattr__(self, "_payload", cached)
+        return cached.copy()
+
+    def _build_payload(self) -> dict[str, Any]:
+        """Build the payload from the class's key declarations."""
+        result = {key: getattr(self, key) for key in self._REQUIRED_KEYS}
+        for key in self._OPTIONAL_KEYS:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value
+        fallback_key = self._TEXT_FALLBACK_KEY
+        if fallback_key is not None:
+            value = getattr(self, fallback_key) or self.text
+            if value is not None:
+                result[fallback_key] = value
         return result
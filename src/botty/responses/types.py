@@ -1,17 +1,13 @@
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Any, Literal, TypeAlias
+from typing import Literal, TypeAlias
 
 from telegram.constants import ParseMode
 
 from .base import BaseAnswer
 
 
-def _clean_dict(d: dict) -> dict:
-    """Remove keys with None values."""
-    return {k: v for k, v in d.items() if v is not None}
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Answer(BaseAnswer):
     """Send a simple text message.
 
@@ -29,7 +25,7 @@ class Answer(BaseAnswer):
 
 
 # TODO: add editing of other types of messages: photo, video and so on.
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EditAnswer(BaseAnswer):
     """Edit a previously sent message.
 
@@ -59,7 +55,7 @@ class EditAnswer(BaseAnswer):
     message_key: str | None = field(default=None, kw_only=True)  # Reference by key
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmptyAnswer(BaseAnswer):
     """A response that does nothing (no message is sent).
 
@@ -79,7 +75,7 @@ class EmptyAnswer(BaseAnswer):
     parse_mode: ParseMode | None = field(default=None, kw_only=True)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PhotoAnswer(BaseAnswer):
     """Send a photo.
 
@@ -103,20 +99,12 @@ class PhotoAnswer(BaseAnswer):
     photo: str | bytes
     caption: str | None = field(default=None, kw_only=True)
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "photo": self.photo,
-                "caption": self.caption or self.text,
-                "parse_mode": self.parse_mode,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
+    _REQUIRED_KEYS = ("photo", "disable_notification", "protect_content")
+    _OPTIONAL_KEYS = ("parse_mode", "reply_markup")
+    _TEXT_FALLBACK_KEY = "caption"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentAnswer(BaseAnswer):
     """Send a document (file).
 
@@ -144,21 +132,12 @@ class DocumentAnswer(BaseAnswer):
     filename: str | None = field(default=None, kw_only=True)
     caption: str | None = field(default=None, kw_only=True)
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "document": self.document,
-                "filename": self.filename,
-                "caption": self.caption or self.text,
-                "parse_mode": self.parse_mode,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
-
-
-@dataclass
+    _REQUIRED_KEYS = ("document", "disable_notification", "protect_content")
+    _OPTIONAL_KEYS = ("filename", "parse_mode", "reply_markup")
+    _TEXT_FALLBACK_KEY = "caption"
+
+
+@dataclass(slots=True, frozen=True)
 class AudioAnswer(BaseAnswer):
     """Send an audio file (typically music).
 
@@ -189,23 +168,12 @@ class AudioAnswer(BaseAnswer):
     duration: int | None = field(default=None, kw_only=True)
     performer: str | None = field(default=None, kw_only=True)
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "audio": self.audio,
-                "caption": self.caption or self.text,
-                "parse_mode": self.parse_mode,
-                "duration": self.duration,
-                "performer": self.performer,
-                "title": self.title,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
-
-
-@dataclass
+    _REQUIRED_KEYS = ("audio", "disable_notification", "protect_content")
+    _OPTIONAL_KEYS = ("parse_mode", "duration", "performer", "title", "reply_markup")
+    _TEXT_FALLBACK_KEY = "caption"
+
+
+@dataclass(slots=True, frozen=True)
 class VideoAnswer(BaseAnswer):
     """Send a video.
 
@@ -237,24 +205,17 @@ class VideoAnswer(BaseAnswer):
     height: int | None = field(default=None, kw_only=True)
     supports_streaming: bool = False
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "video": self.video,
-                "caption": self.caption or self.text,
-                "parse_mode": self.parse_mode,
-                "duration": self.duration,
-                "width": self.width,
-                "height": self.height,
-                "supports_streaming": self.supports_streaming,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
-
-
-@dataclass
+    _REQUIRED_KEYS = (
+        "video",
+        "supports_streaming",
+        "disable_notification",
+        "protect_content",
+    )
+    _OPTIONAL_KEYS = ("parse_mode", "duration", "width", "height", "reply_markup")
+    _TEXT_FALLBACK_KEY = "caption"
+
+
+@dataclass(slots=True, frozen=True)
 class VoiceAnswer(BaseAnswer):
     """Send a voice note (audio in OGG format).
 
@@ -280,21 +241,12 @@ class VoiceAnswer(BaseAnswer):
     caption: str | None = field(default=None, kw_only=True)
     duration: int | None = field(default=None, kw_only=True)
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "voice": self.voice,
-                "caption": self.caption or self.text,
-                "parse_mode": self.parse_mode,
-                "duration": self.duration,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
-
-
-@dataclass
+    _REQUIRED_KEYS = ("voice", "disable_notification", "protect_content")
+    _OPTIONAL_KEYS = ("parse_mode", "duration", "reply_markup")
+    _TEXT_FALLBACK_KEY = "caption"
+
+
+@dataclass(slots=True, frozen=True)
 class LocationAnswer(BaseAnswer):
     """Send a geographic location.
 
@@ -327,23 +279,22 @@ class LocationAnswer(BaseAnswer):
     heading: int | None = field(default=None, kw_only=True)
     proximity_alert_radius: int | None = field(default=None, kw_only=True)
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "latitude": self.latitude,
-                "longitude": self.longitude,
-                "horizontal_accuracy": self.horizontal_accuracy,
-                "live_period": self.live_period,
-                "heading": self.heading,
-                "proximity_alert_radius": self.proximity_alert_radius,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
-
-
-@dataclass
+    _REQUIRED_KEYS = (
+        "latitude",
+        "longitude",
+        "disable_notification",
+        "protect_content",
+    )
+    _OPTIONAL_KEYS = (
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+        "reply_markup",
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class VenueAnswer(BaseAnswer):
     """Send information about a venue.
 
@@ -378,25 +329,24 @@ class VenueAnswer(BaseAnswer):
     google_place_id: str | None = field(default=None, kw_only=True)
     google_place_type: str | None = field(default=None, kw_only=True)
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "latitude": self.latitude,
-                "longitude": self.longitude,
-                "title": self.title,
-                "address": self.address,
-                "foursquare_id": self.foursquare_id,
-                "foursquare_type": self.foursquare_type,
-                "google_place_id": self.google_place_id,
-                "google_place_type": self.google_place_type,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
-
-
-@dataclass
+    _REQUIRED_KEYS = (
+        "latitude",
+        "longitude",
+        "title",
+        "address",
+        "disable_notification",
+        "protect_content",
+    )
+    _OPTIONAL_KEYS = (
+        "foursquare_id",
+        "foursquare_type",
+        "google_place_id",
+        "google_place_type",
+        "reply_markup",
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class ContactAnswer(BaseAnswer):
     """Send a phone contact.
 
@@ -425,24 +375,19 @@ class ContactAnswer(BaseAnswer):
     last_name: str | None = field(default=None, kw_only=True)
     vcard: str | None = field(default=None, kw_only=True)
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "phone_number": self.phone_number,
-                "first_name": self.first_name,
-                "last_name": self.last_name,
-                "vcard": self.vcard,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
+    _REQUIRED_KEYS = (
+        "phone_number",
+        "first_name",
+        "disable_notification",
+        "protect_content",
+    )
+    _OPTIONAL_KEYS = ("last_name", "vcard", "reply_markup")
 
 
 PollTypes: TypeAlias = Literal["regular"] | Literal["quiz"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PollAnswer(BaseAnswer):
     """Send a poll.
 
@@ -450,7 +395,8 @@ class PollAnswer(BaseAnswer):
 
     Attributes:
         question: Poll question (overrides `text` if provided).
-        options: List of answer strings.
+        options: Answer strings. Stored as a tuple; passing a tuple (e.g. a
+            module-level constant) avoids the conversion.
         is_anonymous: Whether votes are anonymous (default True).
         type: "regular" or "quiz".
         allows_multiple_answers: For regular polls, allow multiple selections.
@@ -475,7 +421,7 @@ class PollAnswer(BaseAnswer):
     """
 
     question: str
-    options: list[str]
+    options: Sequence[str]
     is_anonymous: bool = field(default=True, kw_only=True)
     type: PollTypes = "regular"
     allows_multiple_answers: bool = field(default=False, kw_only=True)
@@ -486,25 +432,29 @@ class PollAnswer(BaseAnswer):
     close_date: int | None = field(default=None, kw_only=True)
     is_closed: bool = field(default=False, kw_only=True)
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "question": self.question or self.text,
-                "options": self.options,
-                "is_anonymous": self.is_anonymous,
-                "type": self.type,
-                "allows_multiple_answers": self.allows_multiple_answers,
-                "correct_option_id": self.correct_option_id,
-                "explanation": self.explanation,
-                "explanation_parse_mode": self.explanation_parse_mode,
-                "open_period": self.open_period,
-                "close_date": self.close_date,
-                "is_closed": self.is_closed,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
+    def __post_init__(self) -> None:
+        # A tuple keeps the frozen answer (and its cached payload) immutable.
+        if type(self.options) is not tuple:
+            object.__setattr__(self, "options", tuple(self.options))
+
+    _REQUIRED_KEYS = (
+        "options",
+        "is_anonymous",
+        "type",
+        "allows_multiple_answers",
+        "is_closed",
+        "disable_notification",
+        "protect_content",
+    )
+    _OPTIONAL_KEYS = (
+        "correct_option_id",
+        "explanation",
+        "explanation_parse_mode",
+        "open_period",
+        "close_date",
+        "reply_markup",
+    )
+    _TEXT_FALLBACK_KEY = "question"
 
 
 DiceEmojis: TypeAlias = (
@@ -517,7 +467,7 @@ DiceEmojis: TypeAlias = (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiceAnswer(BaseAnswer):
     """Send a dice with an animated emoji.
 
@@ -536,12 +486,5 @@ class DiceAnswer(BaseAnswer):
 
     emoji: DiceEmojis = "🎲"  # 🎲, 🎯, 🏀, ⚽, 🎰, 🎳
 
-    def to_dict(self) -> dict[str, Any]:
-        return _clean_dict(
-            {
-                "emoji": self.emoji,
-                "reply_markup": self.reply_markup,
-                "disable_notification": self.disable_notification,
-                "protect_content": self.protect_content,
-            }
-        )
+    _REQUIRED_KEYS = ("emoji", "disable_notification", "protect_content")
+    _OPTIONAL_KEYS = ("reply_markup",)
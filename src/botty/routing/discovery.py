@@ -1,8 +1,12 @@
+import functools
 import importlib
+import os
+import pkgutil
 import sys
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from pathlib import Path
+from stat import S_IFDIR, S_IFREG, S_ISDIR
 from types import ModuleType
 
 from loguru import logger
@@ -32,6 +36,23 @@ class ModuleSystem(ABC):
     @abstractmethod
     def glob(self, path: Path, pattern: str) -> Iterable[Path]: ...
 
+    def stat(self, path: Path) -> os.stat_result | None:
+        """Return the stat result for a path, or None if it does not exist.
+
+        The default is built from `path_exists` and `is_dir` and only fills
+        in the file type.
+        """
+        if not self.path_exists(path):
+            return None
+        mode = S_IFDIR if self.is_dir(path) else S_IFREG
+        return os.stat_result((mode, 0, 0, 0, 0, 0, 0, 0, 0, 0))
+
+    def iter_modules(self, path: Path) -> Iterable[str]:
+        """Yield the names of the plain modules directly inside a package."""
+        for py_file in self.glob(path, "*.py"):
+            if py_file.name != "__init__.py":
+                yield py_file.stem
+
 
 class RealModuleSystem(ModuleSystem):
     def add_to_sys_path(self, path: Path) -> None:
@@ -40,6 +61,11 @@ class RealModuleSystem(ModuleSystem):
             logger.debug(f"Added project root to sys.path: {path}")
 
     def import_module(self, module_name: str):
+        # Already-imported handler modules (repeated discovery in tests or
+        # dev reloads) are reused without going through the import machinery.
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
         return importlib.import_module(module_name)
 
     def path_exists(self, path: Path) -> bool:
@@ -48,9 +74,22 @@ class RealModuleSystem(ModuleSystem):
     def is_dir(self, path: Path) -> bool:
         return path.is_dir()
 
+    def stat(self, path: Path) -> os.stat_result | None:
+        try:
+            return os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     def glob(self, path: Path, pattern: str):
         return path.glob(pattern)
 
+    def iter_modules(self, path: Path) -> Iterable[str]:
+        # Uses the import system's own directory listing: one scan, and
+        # sourceless (.pyc-only) handler modules are found too.
+        for info in pkgutil.iter_modules([str(path)]):
+            if not info.ispkg:
+                yield info.name
+
 
 def discover_routers(
     path: Path | None = None,
@@ -115,13 +154,15 @@ def _validate_handlers_package(
     module_system: ModuleSystem,
 ) -> None:
 
-    if not module_system.path_exists(path):
+    # One stat answers both "exists" and "is a directory".
+    st = module_system.stat(path)
+    if st is None:
         raise HandlerDiscoveryError(f"{path} does not exist")
 
-    if not module_system.is_dir(path):
+    if not S_ISDIR(st.st_mode):
         raise HandlerDiscoveryError(f"{path} isn't a directory")
 
-    if not module_system.path_exists(path / "__init__.py"):
+    if module_system.stat(path / "__init__.py") is None:
         raise HandlerDiscoveryError(
             f"{path} is not a python package",
             suggestion="Consider adding __init__.py to make it importable",
@@ -138,17 +179,14 @@ def _discover_modules(
 
     routers: list[tuple[str, Router]] = []
 
-    for py_file in module_system.glob(path, "*.py"):
-        if py_file.name == "__init__.py":
-            continue
-
-        module_name = f"{base_package}.{py_file.stem}"
+    for name in module_system.iter_modules(path):
+        module_name = f"{base_package}.{name}"
 
         module = _safe_import(module_name, module_system)
         if module is None:
             continue
 
-        routers.extend(_extract_routers_from_module(py_file.stem, module))
+        routers.extend(_extract_routers_from_module(name, module))
 
     return routers
 
@@ -157,8 +195,13 @@ def _find_project_root() -> Path:
     """
     Find project root by looking for pyproject.toml, setup.py, .git
     """
-    start = Path.cwd().absolute()
+    return _project_root_for(Path.cwd().absolute())
 
+
+# Keyed by the working directory, so repeated discovery (tests, reloads)
+# does not stat every parent again, while a chdir still gets a fresh search.
+@functools.lru_cache(maxsize=8)
+def _project_root_for(start: Path) -> Path:
     for current in [start] + list(start.parents):
         if any(
             (current / file).exists() for file in ["pyproject.toml", "setup.py", ".git"]
@@ -190,8 +233,9 @@ def _extract_routers_from_module(
     routers = []
 
     try:
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
+        # The module namespace dict is enough here; dir() would sort every
+        # name and getattr() each one back out of the same dict.
+        for attr in vars(module).values():
             if isinstance(attr, Router):
                 routers.append((module_name, attr))
     except Exception as e:
@@ -205,8 +249,6 @@ def _log_discovered(routers: list[tuple[str, Router]]) -> None:
     if not routers:
         return
 
-    message = "📦 Discovered routers:"
-    for name, _ in routers:
-        message += f"\n - {name}"
-
-    logger.info(message)
+    logger.info(
+        "📦 Discovered routers:" + "".join(f"\n - {name}" for name, _ in routers)
+    )
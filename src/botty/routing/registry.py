@@ -8,10 +8,13 @@ from ..domain import Message
 from ..responses import EditAnswer
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MessageRecord:
     """Record about a sent message stored in the MessageRegistry.
 
+    Records are immutable once registered; the registry indexes the same
+    object from several places.
+
     Attributes:
         message_id: Telegram message ID.
         chat_id: Telegram chat ID.
@@ -25,15 +28,22 @@ class MessageRecord:
     handler_name: str
     timestamp: float
     metadata: dict = field(default_factory=dict)
+    # Monotonic clock reading (ns) matching `timestamp`. The wall clock is
+    # only consulted once, here; ages are then unaffected by clock changes.
+    _sent_mono_ns: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        age_ns = int((time.time() - self.timestamp) * 1e9)
+        object.__setattr__(self, "_sent_mono_ns", time.monotonic_ns() - age_ns)
 
     @property
     def age(self) -> float:
         """Get age of message in seconds."""
-        return time.time() - self.timestamp
+        return (time.monotonic_ns() - self._sent_mono_ns) * 1e-9
 
     def is_older_than(self, seconds: float) -> bool:
         """Check if message is older than given seconds."""
-        return self.age > seconds
+        return time.monotonic_ns() - self._sent_mono_ns > seconds * 1e9
 
 
 class MessageRegistry:
@@ -70,9 +80,12 @@ class MessageRegistry:
         self._key_registry: dict[str, MessageRecord] = (
             dict()
         )  # mapping of keys to chat_id
-        self._handler_registry: dict[str, list[MessageRecord]] = (
+        self._handler_registry: dict[str, deque[MessageRecord]] = (
             dict()
-        )  # mapping of handlers to chat_id list
+        )  # mapping of handlers to their records, oldest first
+        # Reverse of _key_registry: (chat_id, message_id) -> keys, so evicting
+        # a record does not have to scan every key.
+        self._record_keys: dict[tuple[int, int], set[str]] = dict()
 
         logger.debug(
             f"Initialized MessageRegistry: max_per_chat={max_messages_per_chat}, "
@@ -129,13 +142,20 @@ class MessageRegistry:
             self._cleanup_record_references(old_record)
 
         if key:
-            if key in self._key_registry:
+            replaced = self._key_registry.get(key)
+            if replaced is not None:
                 logger.debug(f"Replacing existing key mapping: {key}")
+                self._record_keys.get(
+                    (replaced.chat_id, replaced.message_id), set()
+                ).discard(key)
             self._key_registry[key] = record
+            self._record_keys.setdefault(
+                (record.chat_id, record.message_id), set()
+            ).add(key)
 
         if handler_name:
             if handler_name not in self._handler_registry:
-                self._handler_registry[handler_name] = []
+                self._handler_registry[handler_name] = deque()
             self._handler_registry[handler_name].append(record)
 
         return record
@@ -178,18 +198,19 @@ class MessageRegistry:
             limit: Maximum number of messages (most recent first).
 
         Returns:
-            List of matching MessageRecords.
+            List of matching MessageRecords, most recently registered first.
         """
-        records = self._handler_registry.get(handler_name, []).copy()
-
-        if chat_id:
-            records = [r for r in records if r.chat_id == chat_id]
-
-        records = sorted(records, key=lambda r: r.timestamp, reverse=True)
-
-        # Apply limit
-        if limit:
-            records = records[:limit]
+        # Records are appended as they are registered, so walking the deque
+        # backwards yields them newest first without sorting. Message dates
+        # only have second precision, so sorting by timestamp could not
+        # order messages sent within the same second anyway.
+        records = []
+        for record in reversed(self._handler_registry.get(handler_name, ())):
+            if chat_id and record.chat_id != chat_id:
+                continue
+            records.append(record)
+            if limit and len(records) >= limit:
+                break
 
         return records
 
@@ -218,16 +239,19 @@ class MessageRegistry:
 
     def _cleanup_record_references(self, record: MessageRecord) -> None:
         """Remove all references to a record from secondary indexes."""
-        # Remove from key registry
-        keys_to_remove = [
-            k
-            for k, v in self._key_registry.items()
-            if v.message_id == record.message_id
-        ]
-        for key in keys_to_remove:
-            del self._key_registry[key]
-
-        # Remove from handler registry
+        # Remove from key registry. An edited message is registered again
+        # under the same IDs, so only keys still pointing at this record go.
+        message = (record.chat_id, record.message_id)
+        keys = self._record_keys.get(message)
+        if keys:
+            for key in [k for k in keys if self._key_registry.get(k) is record]:
+                del self._key_registry[key]
+                keys.discard(key)
+        if not keys:
+            self._record_keys.pop(message, None)
+
+        # Remove from handler registry. The evicted record is among the
+        # oldest, so the scan from the left of the deque stops early.
         if record.handler_name in self._handler_registry:
             try:
                 self._handler_registry[record.handler_name].remove(record)
@@ -269,12 +293,12 @@ class MessageRegistry:
         # 3. Handler name was specified by user
         if answer.handler_name is not None:
             records = self.get_by_handler(answer.handler_name, chat_id)
-            if len(records) > 0:
+            if records:
                 return records[0].message_id
 
         # 4. Last message from current handler
         records = self.get_by_handler(handler_name, chat_id)
-        if len(records) > 0:
+        if records:
             return records[0].message_id
 
         # 5. Last message in chat (fallback)
@@ -67,6 +67,9 @@ class ResponseProcessor:
         chat_id: int,
         handler_name: str,
     ) -> Message | None:
+        if isinstance(answer, EmptyAnswer):
+            # Nothing to send: skip the client call and the registry.
+            return None
         try:
             if isinstance(answer, EditAnswer):
                 message_id: int | None = self.registry.find_message_to_edit(
@@ -79,10 +82,9 @@ class ResponseProcessor:
                 message = await self.client.send(chat_id, answer)
 
             if message is None:
-                if not isinstance(answer, EmptyAnswer):
-                    logger.warning(
-                        f"Message was not sent: {answer.handler_name or handler_name}"
-                    )
+                logger.warning(
+                    f"Message was not sent: {answer.handler_name or handler_name}"
+                )
                 return None
 
             # Register the message for future reference
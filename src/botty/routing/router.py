@@ -1,9 +1,12 @@
+import asyncio
+import re
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
-from functools import wraps
-from typing import AsyncIterator
+from functools import lru_cache, wraps
 
 from telegram import Update as TGUpdate
 from telegram.ext import (
+    BaseHandler,
     CallbackQueryHandler,
     CommandHandler,
     InlineQueryHandler,
@@ -20,6 +23,30 @@ from .response_processor import ResponseProcessor
 from .validation import validate_handler
 
 
+@lru_cache(maxsize=None)
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a handler pattern, sharing one object between equal patterns."""
+    return re.compile(pattern)
+
+
+# Handler kind -> builder taking the rest of a `Router.handlers` entry.
+_PTB_BUILDERS: dict[str, Callable[..., BaseHandler]] = {
+    "command": lambda commands, wrapper: CommandHandler(commands, wrapper),
+    "callback_query": lambda pattern, wrapper: CallbackQueryHandler(
+        wrapper, pattern=pattern
+    ),
+    "message": lambda filters_obj, wrapper: MessageHandler(
+        filters_obj or filters.ALL, wrapper
+    ),
+    "inline_query": lambda pattern, wrapper: InlineQueryHandler(
+        wrapper, pattern=pattern
+    ),
+    "prefix": lambda prefix, commands, wrapper: PrefixHandler(
+        prefix, commands, wrapper
+    ),
+}
+
+
 class Router:
     """Router that collects handlers and converts them to PTB handlers.
 
@@ -52,6 +79,8 @@ class Router:
         self.name = name or "router"
         self.handlers = []
         self.incoming_adapter = PTBIncomingAdapter()
+        self._resolver: DependencyResolver | None = None
+        self._processor: ResponseProcessor | None = None
 
     @asynccontextmanager
     async def request_scope(
@@ -69,20 +98,63 @@ class Router:
         finally:
             scope.close()
 
+    def _get_services(
+        self, context: ContextProtocol
+    ) -> tuple[DependencyResolver, ResponseProcessor]:
+        """Return the resolver and processor for the application's bot data.
+
+        Both are stateless apart from the bot-wide objects they wrap, so they
+        are built once and reused for every update. They are rebuilt only if
+        the router is served by a different container, registry or client.
+        """
+        bot_data = context.bot_data
+        resolver = self._resolver
+        if resolver is None or resolver.container is not bot_data.dependency_container:
+            resolver = self._resolver = DependencyResolver(
+                bot_data.dependency_container
+            )
+        processor = self._processor
+        if (
+            processor is None
+            or processor.registry is not bot_data.message_registry
+            or processor.client is not bot_data.bot_client
+        ):
+            processor = self._processor = ResponseProcessor(
+                bot_data.message_registry, bot_data.bot_client
+            )
+        return resolver, processor
+
     async def _wrap_function(
         self, func: Handler, tg_update: TGUpdate, context: ContextProtocol
     ):
         """Internal wrapper that resolves dependencies, executes the handler,
         and processes its responses.
+
+        Updates from the same chat are handled one at a time, in arrival
+        order, so handlers stay sequential per chat even when the
+        application processes updates concurrently.
         """
-        handler_name: str = func.__name__
-        resolver = DependencyResolver(context.bot_data.dependency_container)
-        processor = ResponseProcessor(
-            context.bot_data.message_registry, context.bot_data.bot_client
-        )
         update = self.incoming_adapter.from_ptb(tg_update)
+        chat_id = update.effective_chat_id
+        if chat_id is None:
+            return await self._run_handler(func, update, context)
+
+        chat_locks = context.bot_data.chat_locks
+        lock = chat_locks.get(chat_id)
+        if lock is None:
+            lock = chat_locks[chat_id] = asyncio.Lock()
+        async with lock:
+            return await self._run_handler(func, update, context)
+
+    async def _run_handler(
+        self, func: Handler, update: Update, context: ContextProtocol
+    ):
+        handler_name: str = func.__name__
+        resolver, processor = self._get_services(context)
         async with self.request_scope(update, context) as scope:
-            kwargs = await resolver.resolve_handler(func, scope)
+            kwargs = resolver.resolve_from_scope(func, scope)
+            if kwargs is None:
+                kwargs = await resolver.resolve_handler(func, scope)
 
             generator = func(**kwargs)
             return await processor.process_async_generator(
@@ -111,17 +183,18 @@ class Router:
             func: Handler,
         ):
             validate_handler(func, handler_type="command")
+            DependencyResolver.prepare(func)
 
             @wraps(func)
             async def wrapper(update: TGUpdate, context: ContextProtocol):
                 return await self._wrap_function(func, update, context)
 
-            if isinstance(commands, str):
-                self.handlers.append(("command", commands, wrapper))
-            else:
-                self.handlers.extend(
-                    ("command", command, wrapper) for command in commands
-                )
+            # PTB matches a list of commands natively, so aliases share one
+            # handler instead of being checked one by one on every update.
+            # Copied so later changes to the caller's list do not alter the
+            # registered route.
+            names = commands if isinstance(commands, str) else tuple(commands)
+            self.handlers.append(("command", names, wrapper))
             return wrapper
 
         return decorator
@@ -149,12 +222,14 @@ class Router:
 
         def decorator(func: Handler):
             validate_handler(func, handler_type="callback_query")
+            DependencyResolver.prepare(func)
 
             @wraps(func)
             async def wrapper(update: TGUpdate, context: ContextProtocol):
                 return await self._wrap_function(func, update, context)
 
-            self.handlers.append(("callback_query", pattern, wrapper))
+            compiled = _compile(pattern)
+            self.handlers.append(("callback_query", compiled, wrapper))
             return wrapper
 
         return decorator
@@ -180,6 +255,7 @@ class Router:
 
         def decorator(func: Handler):
             validate_handler(func, handler_type="message")
+            DependencyResolver.prepare(func)
 
             @wraps(func)
             async def wrapper(update: TGUpdate, context: ContextProtocol):
@@ -213,12 +289,14 @@ class Router:
 
         def decorator(func: Handler):
             validate_handler(func, handler_type="inline_query")
+            DependencyResolver.prepare(func)
 
             @wraps(func)
             async def wrapper(update: TGUpdate, context: ContextProtocol):
                 return await self._wrap_function(func, update, context)
 
-            self.handlers.append(("inline_query", pattern, wrapper))
+            compiled = _compile(pattern) if pattern else None
+            self.handlers.append(("inline_query", compiled, wrapper))
             return wrapper
 
         return decorator
@@ -244,42 +322,22 @@ class Router:
 
         def decorator(func: Handler):
             validate_handler(func, handler_type="prefix")
+            DependencyResolver.prepare(func)
 
             @wraps(func)
             async def wrapper(update: TGUpdate, context: ContextProtocol):
                 return await self._wrap_function(func, update, context)
 
-            if isinstance(commands, str):
-                self.handlers.append(("prefix", prefix, commands, wrapper))
-            else:
-                self.handlers.extend(
-                    ("prefix", prefix, command, wrapper) for command in commands
-                )
+            names = commands if isinstance(commands, str) else tuple(commands)
+            self.handlers.append(("prefix", prefix, names, wrapper))
             return wrapper
 
         return decorator
 
-    def get_handlers(self):
-        """Convert to telegram handlers."""
-        handlers = []
-        for handler_info in self.handlers:
-            if handler_info[0] == "command":
-                handlers.append(CommandHandler(handler_info[1], handler_info[2]))
-            elif handler_info[0] == "callback_query":
-                handlers.append(
-                    CallbackQueryHandler(handler_info[2], pattern=handler_info[1])
-                )
-            elif handler_info[0] == "message":
-                handlers.append(
-                    MessageHandler(handler_info[1] or filters.ALL, handler_info[2])
-                )
-            elif handler_info[0] == "inline_query":
-                handlers.append(
-                    InlineQueryHandler(handler_info[2], pattern=handler_info[1])
-                )
-            elif handler_info[0] == "prefix":
-                # Custom handler needed – suggest creating a PrefixCommandHandler
-                handlers.append(
-                    PrefixHandler(handler_info[1], handler_info[2], handler_info[3])
-                )
-        return handlers
+    def get_handlers(self) -> list[BaseHandler]:
+        """Convert to telegram handlers.
+
+        Built from `handlers`, which stays the single record of what was
+        registered.
+        """
+        return [_PTB_BUILDERS[info[0]](*info[1:]) for info in self.handlers]
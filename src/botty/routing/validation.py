@@ -7,14 +7,18 @@ and provides helpful error messages for common mistakes.
 
 from collections.abc import AsyncGenerator
 from botty.di import Handler
+from botty.di.utils import _get_parameters
 
 import inspect
-from typing import Any, get_type_hints
+from typing import Any
 
 from loguru import logger
 
 from ..exceptions import InvalidHandlerError
 
+_UPDATE_NAMES = frozenset({"update", "_update"})
+_CONTEXT_NAMES = frozenset({"context", "ctx", "_context"})
+
 
 def validate_handler(func: Handler, handler_type: str = "command") -> None:
     """
@@ -43,9 +47,9 @@ def validate_handler(func: Handler, handler_type: str = "command") -> None:
             suggestion=f"Change 'def {func_name}(...)' to 'async def {func_name}(...)'",
         )
 
-    # Check signature
-    sig = inspect.signature(func)
-    params = list(sig.parameters.keys())
+    # Check signature. The parameter list is cached and reused when the
+    # handler's dependency plan is built right after validation.
+    params = [name for name, _ in _get_parameters(func)]
 
     # Must have at least update and context
     if len(params) < 2:
@@ -56,24 +60,23 @@ def validate_handler(func: Handler, handler_type: str = "command") -> None:
         )
 
     # First two params should be update and context
-    if params[0] not in ("update", "_update"):
+    if params[0] not in _UPDATE_NAMES:
         logger.warning(
             f"Handler '{func_name}': First parameter '{params[0]}' should be named 'update'"
         )
 
-    if params[1] not in ("context", "ctx", "_context"):
+    if params[1] not in _CONTEXT_NAMES:
         logger.warning(
             f"Handler '{func_name}': Second parameter '{params[1]}' should be named 'context'"
         )
 
-    # Validate type hints if present
+    # Validate the return type hint if present. The check is advisory, so
+    # postponed (string) annotations are skipped rather than evaluated, which
+    # could import modules at decoration time.
     try:
-        type_hints = get_type_hints(func)
-
-        # Check return type if specified
-        if "return" in type_hints:
-            return_type = type_hints["return"]
+        return_type = inspect.get_annotations(func).get("return")
 
+        if return_type is not None and not isinstance(return_type, str):
             # Check if it's AsyncGenerator[BaseAnswer, None] or similar
             origin = getattr(return_type, "__origin__", None)
             if origin is not None and origin is not AsyncGenerator:
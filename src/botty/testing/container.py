@@ -16,9 +16,9 @@ class TestDependencyContainer(DependencyContainer):
         self._overrides[cls] = instance
 
     async def resolve_dependency(
-        self, dep: Depends, scope: RequestScope, dependency_chain: list[str]
+        self, dep: Depends, request_scope: RequestScope, dependency_chain: list[str]
     ) -> Any:
         # Give precedence to overrides
         if dep.dependency in self._overrides:
             return self._overrides[dep.dependency]
-        return await super().resolve_dependency(dep, scope, dependency_chain)
+        return await super().resolve_dependency(dep, request_scope, dependency_chain)
@@ -20,3 +20,4 @@ class TestMessageRegistry(MessageRegistry):
         self._registry.clear()
         self._key_registry.clear()
         self._handler_registry.clear()
+        self._record_keys.clear()
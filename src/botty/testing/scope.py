@@ -1,3 +1,4 @@
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from sqlmodel import Session
@@ -45,3 +46,11 @@ class TestRequestScope(RequestScope):
         if dep.dependency in self.overrides:
             return self.overrides[dep.dependency]
         return None
+
+    async def get_or_set(
+        self, key: Dependency, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        # Overrides are consulted after the cache and are not cached themselves
+        if key not in self.cache and key in self.overrides:
+            return self.overrides[key]
+        return await super().get_or_set(key, factory)
@@ -43,6 +43,11 @@ class TestAppBuilder:
         builder = AppBuilder().manual_routes()
         assert builder._discovery is False
 
+    def test_concurrent_updates_setter(self):
+        assert AppBuilder()._concurrent_updates is False
+        builder = AppBuilder().concurrent_updates(8)
+        assert builder._concurrent_updates == 8
+
     @patch("botty.application.builder.discover_routers")
     def test_build_with_discovery(self, mock_discover):
         mock_discover.return_value = [Router(name="discovered")]
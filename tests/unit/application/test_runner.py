@@ -71,3 +71,12 @@ class TestApplication:
         app.launch()
 
         mock_ptb_app.run_polling.assert_called_once()
+
+    @patch("botty.application.runner.PTBApplicationBuilder")
+    def test_concurrent_updates_passed_to_ptb(self, mock_ptb_builder_cls):
+        builder = mock_ptb_builder_cls.return_value.token.return_value.context_types.return_value
+
+        Application("token", None, [], concurrent_updates=4)
+
+        builder.concurrent_updates.assert_called_once_with(4)
+        builder.concurrent_updates.return_value.build.assert_called_once()
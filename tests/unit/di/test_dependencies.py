@@ -1,4 +1,5 @@
 # tests/unit/router/dependencies.py
+import asyncio
 from typing import Annotated
 from unittest.mock import Mock
 
@@ -14,7 +15,8 @@ from botty import (
 )
 from botty.context import ContextProtocol
 from botty.di import DependencyResolver, RequestScope
-from botty.exceptions import DependencyResolutionError
+from botty.exceptions import DependencyResolutionError, EffectiveUserNotFound
+from botty.helpers import InjectableUser, _get_effective_message, _get_effective_user
 from botty.testing import TestContext, TestDependencyContainer
 
 
@@ -110,6 +112,63 @@ class TestDependencyExtraction:
         assert isinstance(dep, Depends)
         assert dep.dependency is simple_dep
 
+    def test_resolution_plan_is_cached_per_callable(self):
+        from botty.di.utils import _get_plan
+
+        plan = _get_plan(two_deps_handler)
+        assert [action.kind for action in plan] == [
+            "update",
+            "context",
+            "depends",
+            "depends",
+        ]
+        assert plan[2].payload is Depends(simple_dep)
+        assert _get_plan(two_deps_handler) is plan
+
+    def test_depends_markers_are_canonical(self):
+        assert Depends(simple_dep) is Depends(simple_dep)
+        assert Depends(simple_dep) is not Depends(simple_dep, use_cache=False)
+        assert Depends(simple_dep) is not Depends(simple_dep, scope="process")
+
+    def test_get_parameters_is_cached_per_callable(self):
+        import inspect
+
+        from botty.di.utils import _get_parameters
+
+        params = _get_parameters(two_deps_handler)
+        assert [name for name, _ in params] == ["update", "context", "a", "b"]
+        assert params[0][1] is Update
+        assert _get_parameters(two_deps_handler) is params
+        assert _get_parameters(no_annotation_handler)[2] == (
+            "unknown",
+            inspect.Parameter.empty,
+        )
+
+    def test_get_parameters_resolves_string_annotations(self):
+        from botty.di.utils import _extract_depends, _get_parameters
+
+        async def handler(
+            update: "Update", value: "Annotated[str, Depends(simple_dep)]"
+        ):
+            yield None
+
+        params = dict(_get_parameters(handler))
+        assert params["update"] is Update
+        assert _extract_depends(params["value"]).dependency is simple_dep
+
+    def test_get_parameters_skips_variadic_parameters(self):
+        from functools import partial
+
+        from botty.di.utils import _get_parameters
+
+        def dep(update: Update, *args, flag: bool = False, **kwargs): ...
+
+        assert _get_parameters(dep) == (("update", Update), ("flag", bool))
+        assert _get_parameters(partial(dep, flag=True)) == (
+            ("update", Update),
+            ("flag", bool),
+        )
+
 
 class TestBasicInjection:
     """Test injection of built‑in types, repositories, and services."""
@@ -144,6 +203,14 @@ class TestBasicInjection:
         assert isinstance(svc1, SettingsService)
         assert svc1 is svc2  # singleton
 
+    def test_resolve_from_scope_for_update_and_context_only(
+        self, resolver, request_scope
+    ):
+        kwargs = resolver.resolve_from_scope(update_handler, request_scope)
+        assert kwargs["upd"] is request_scope.update
+        assert kwargs["context"] is request_scope.context
+        assert resolver.resolve_from_scope(session_handler, request_scope) is None
+
 
 class TestDependsAnnotation:
     """Tests for handlers that use Annotated with Depends."""
@@ -161,6 +228,55 @@ class TestDependsAnnotation:
         assert kwargs["a"] == "hello"
         assert kwargs["b"] == 42
 
+    async def test_shared_cached_subdependency_runs_once(self, resolver, request_scope):
+        import asyncio
+
+        calls = 0
+
+        async def shared() -> object:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return object()
+
+        async def first(value: Annotated[object, Depends(shared)]) -> object:
+            return value
+
+        async def second(value: Annotated[object, Depends(shared)]) -> object:
+            return value
+
+        async def handler(
+            update: Update,
+            context: Context,
+            x: Annotated[object, Depends(first)],
+            y: Annotated[object, Depends(second)],
+        ): ...
+
+        kwargs = await resolver.resolve_handler(handler, request_scope)  # ty: ignore [invalid-argument-type]
+        assert calls == 1
+        assert kwargs["x"] is kwargs["y"]
+
+    async def test_failing_dependency_stops_later_ones(self, resolver, request_scope):
+        started = []
+
+        async def fails() -> str:
+            raise RuntimeError("boom")
+
+        async def later() -> str:
+            started.append("later")
+            return "later"
+
+        async def handler(
+            update: Update,
+            context: Context,
+            a: Annotated[str, Depends(fails)],
+            b: Annotated[str, Depends(later)],
+        ): ...
+
+        with pytest.raises(DependencyResolutionError):
+            await resolver.resolve_handler(handler, request_scope)  # ty: ignore [invalid-argument-type]
+        assert started == []
+
 
 class TestCaching:
     """Tests for the caching behaviour of dependencies."""
@@ -181,6 +297,21 @@ class TestCaching:
 
         assert call_count == 1
 
+    async def test_cached_none_is_not_recomputed(self, container, request_scope):
+        call_count = 0
+
+        async def dep_func():
+            nonlocal call_count
+            call_count += 1
+            return None
+
+        dep = Depends(dep_func, use_cache=True)
+
+        await container.resolve_dependency(dep, request_scope, [])
+        await container.resolve_dependency(dep, request_scope, [])
+
+        assert call_count == 1
+
     async def test_dependency_not_cached_if_disabled(self, container, request_scope):
         call_count = 0
 
@@ -225,6 +356,140 @@ class TestCaching:
         assert inner_call_count == 1
         assert outer_call_count == 2
 
+    async def test_process_scope_shared_across_requests(
+        self, container, sample_update, test_context
+    ):
+        call_count = 0
+
+        async def load_settings():
+            nonlocal call_count
+            call_count += 1
+            return {"theme": "dark"}
+
+        dep = Depends(load_settings, scope="process")
+
+        first = await container.resolve_dependency(
+            dep, RequestScope(sample_update, test_context), []
+        )
+        second = await container.resolve_dependency(
+            dep, RequestScope(sample_update, test_context), []
+        )
+
+        assert first is second
+        assert call_count == 1
+
+    async def test_invalidate_process_cache_recomputes(self, container, request_scope):
+        call_count = 0
+
+        def load_settings():
+            nonlocal call_count
+            call_count += 1
+            return call_count
+
+        dep = Depends(load_settings, scope="process")
+
+        assert await container.resolve_dependency(dep, request_scope, []) == 1
+        container.invalidate_process_cache(dep)
+        assert await container.resolve_dependency(dep, request_scope, []) == 2
+        container.invalidate_process_cache()
+        assert await container.resolve_dependency(dep, request_scope, []) == 3
+
+    async def test_request_scope_override_wins_over_process_cache(
+        self, container, sample_update, test_context
+    ):
+        from botty.testing.scope import TestRequestScope
+
+        def load_settings():
+            return "real"
+
+        dep = Depends(load_settings, scope="process")
+        assert (
+            await container.resolve_dependency(
+                dep, RequestScope(sample_update, test_context), []
+            )
+            == "real"
+        )
+
+        scope = TestRequestScope(
+            sample_update, test_context, overrides={load_settings: "fake"}
+        )
+        assert await container.resolve_dependency(dep, scope, []) == "fake"
+
+    async def test_process_scope_rejects_session_dependency(
+        self, container, request_scope
+    ):
+        def get_repo(session: Session) -> UserRepo:
+            return UserRepo(session)
+
+        def load_users(repo: Annotated[UserRepo, Depends(get_repo)]):
+            return repo
+
+        dep = Depends(load_users, scope="process")
+
+        with pytest.raises(DependencyResolutionError) as exc:
+            await container.resolve_dependency(dep, request_scope, [])
+        assert "reads per-request data" in str(exc.value)
+        assert "'session' of 'get_repo'" in str(exc.value)
+
+    async def test_process_scope_rejects_repository_parameter(
+        self, container, request_scope
+    ):
+        def load_users(repo: UserRepo):
+            return repo
+
+        dep = Depends(load_users, scope="process")
+
+        with pytest.raises(DependencyResolutionError):
+            await container.resolve_dependency(dep, request_scope, [])
+
+    async def test_process_scope_rejects_update_through_sub_dependency(
+        self, container, request_scope
+    ):
+        def greeting(user: InjectableUser) -> str:
+            return f"hello {user.first_name}"
+
+        dep = Depends(greeting, scope="process")
+
+        with pytest.raises(DependencyResolutionError) as exc:
+            await container.resolve_dependency(dep, request_scope, [])
+        assert "'update' of '_get_effective_user'" in str(exc.value)
+
+    async def test_process_scope_rejects_context_parameter(
+        self, container, request_scope
+    ):
+        def load_prefs(context: Context) -> dict:
+            return context.user_data
+
+        dep = Depends(load_prefs, scope="process")
+
+        with pytest.raises(DependencyResolutionError):
+            await container.resolve_dependency(dep, request_scope, [])
+
+    async def test_process_scope_computed_once_under_concurrency(
+        self, container, sample_update, test_context
+    ):
+        call_count = 0
+
+        async def load_settings():
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0)
+            return object()
+
+        dep = Depends(load_settings, scope="process")
+
+        results = await asyncio.gather(
+            *(
+                container.resolve_dependency(
+                    dep, RequestScope(sample_update, test_context), []
+                )
+                for _ in range(3)
+            )
+        )
+
+        assert call_count == 1
+        assert results[0] is results[1] is results[2]
+
 
 class TestErrorCases:
     """Tests for error conditions during dependency resolution."""
@@ -272,6 +537,23 @@ class TestErrorCases:
             await container.resolve_dependency(dep, request_scope, [])
         assert "dependency function not provided" in str(exc.value).lower()
 
+    async def test_missing_user_raises_fresh_error(self, resolver):
+        async def user_handler(update: Update, context: Context, user: InjectableUser):
+            pass
+
+        request_scope = RequestScope(Update(update_id=1), TestContext())
+        causes = []
+        for _ in range(2):
+            with pytest.raises(DependencyResolutionError) as exc:
+                await resolver.resolve_handler(user_handler, request_scope)  # ty: ignore [invalid-argument-type]
+            assert isinstance(exc.value.__cause__, EffectiveUserNotFound)
+            causes.append(exc.value.__cause__)
+        assert causes[0] is not causes[1]
+
+    def test_helper_injectors_keep_their_names(self):
+        assert _get_effective_user.__name__ == "_get_effective_user"
+        assert _get_effective_message.__qualname__ == "_get_effective_message"
+
 
 class TestContainerFeatures:
     """Tests for DependencyContainer itself (singletons, reset)."""
@@ -1,3 +1,4 @@
+import stat
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -6,6 +7,7 @@ import pytest
 from botty import Router
 from botty.exceptions import HandlerDiscoveryError
 from botty.routing import discover_routers
+from botty.routing.discovery import RealModuleSystem
 from botty.testing.discovery import FakeModuleSystem
 
 
@@ -146,7 +148,8 @@ def test_unexpected_exception_is_logged(caplog):
     init_file = handlers / "__init__.py"
 
     class ExplodingModule:
-        def __dir__(self):
+        @property
+        def __dict__(self):
             raise RuntimeError("unexpected")
 
     fake = FakeModuleSystem(
@@ -209,3 +212,13 @@ def test_project_root_added_to_sys_path():
     )
 
     assert project_root in fake.added_sys_paths
+
+
+def test_real_module_system_stat(tmp_path):
+    system = RealModuleSystem()
+    (tmp_path / "module.py").write_text("")
+
+    assert system.stat(tmp_path / "missing") is None
+    assert system.stat(tmp_path / "module.py" / "child") is None
+    assert stat.S_ISDIR(system.stat(tmp_path).st_mode)
+    assert system.stat(tmp_path / "module.py") is not None
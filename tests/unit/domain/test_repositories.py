@@ -70,6 +70,16 @@ class TestBaseRepository:
         assert fetched is not None
         assert fetched.name == "Alice"
 
+    def test_create_without_refresh(self, repo, session):
+        """Skipping the refresh still populates the primary key."""
+        user = UserModel(name="Carol", telegram_id=321)
+        with patch.object(session, "refresh") as refresh:
+            created = repo.create(user, refresh=False)
+
+        refresh.assert_not_called()
+        assert created.id is not None
+        assert session.get(UserModel, created.id) is created
+
     def test_get_existing(self, repo, session):
         """Retrieve an existing entity by ID."""
         user = UserModel(name="Bob", telegram_id=456)
@@ -0,0 +1,75 @@
+# tests/unit/exceptions/test_exceptions.py
+import copy
+import pickle
+
+import pytest
+
+from botty.exceptions import (
+    BottyError,
+    DatabaseNotConfiguredError,
+    DependencyResolutionError,
+    EffectiveUserNotFound,
+    InvalidHandlerError,
+)
+
+
+def _pickle_round_trip(exc):
+    return pickle.loads(pickle.dumps(exc))
+
+
+ROUND_TRIPS = [copy.copy, copy.deepcopy, _pickle_round_trip]
+
+
+class TestExceptionRoundTrip:
+    @pytest.mark.parametrize("round_trip", ROUND_TRIPS)
+    def test_botty_error_keeps_fields(self, round_trip):
+        exc = BottyError("boom", details="more", suggestion="fix it")
+
+        restored = round_trip(exc)
+
+        assert type(restored) is BottyError
+        assert restored.message == "boom"
+        assert restored.details == "more"
+        assert restored.suggestion == "fix it"
+        assert str(restored) == str(exc)
+
+    @pytest.mark.parametrize("round_trip", ROUND_TRIPS)
+    def test_dependency_resolution_error_keeps_fields(self, round_trip):
+        exc = DependencyResolutionError(
+            "Cannot resolve",
+            dependency_chain=["get_db", "get_session"],
+            parameter_name="db",
+            handler_name="start",
+            suggestion="Check the provider",
+        )
+
+        restored = round_trip(exc)
+
+        assert restored.dependency_chain == ("get_db", "get_session")
+        assert restored.parameter_name == "db"
+        assert restored.handler_name == "start"
+        assert restored.details == exc.details
+        assert str(restored) == str(exc)
+
+    @pytest.mark.parametrize("round_trip", ROUND_TRIPS)
+    def test_subclasses_with_custom_init_round_trip(self, round_trip):
+        for exc in (
+            InvalidHandlerError("start", "not async"),
+            DatabaseNotConfiguredError("session"),
+            EffectiveUserNotFound(),
+        ):
+            restored = round_trip(exc)
+
+            assert type(restored) is type(exc)
+            assert restored.to_dict() == exc.to_dict()
+
+
+class TestExceptionRepr:
+    def test_repr_includes_details_and_suggestion(self):
+        exc = DependencyResolutionError(
+            "Cannot resolve", parameter_name="db", suggestion="Check the provider"
+        )
+
+        assert repr(exc) == f"DependencyResolutionError({str(exc)!r})"
+        assert "Parameter: db" in repr(exc)
+        assert "Check the provider" in repr(exc)
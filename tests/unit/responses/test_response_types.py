@@ -1,4 +1,7 @@
 # tests/unit/responses/test_response_types.py
+from dataclasses import FrozenInstanceError, asdict, dataclass, fields, replace
+
+import pytest
 from telegram.constants import ParseMode
 
 from botty.responses import (
@@ -51,6 +54,43 @@ class TestBaseAnswer:
         assert d["reply_markup"] is markup
         assert d["text"] == "Choose"
 
+    def test_to_dict_returns_copy_and_tracks_changes(self):
+        answer = Answer(text="Hi")
+        d = answer.to_dict()
+        d["text"] = "changed"
+        assert answer.to_dict()["text"] == "Hi"
+
+        assert replace(answer, text="Bye").to_dict()["text"] == "Bye"
+
+    def test_media_payload_is_built_once(self):
+        answer = PhotoAnswer(photo="file_id", text="Caption")
+        first = answer.to_dict()
+        first["caption"] = "changed"
+        assert answer.to_dict()["caption"] == "Caption"
+        assert answer._payload is not None
+
+    def test_answers_are_frozen_and_slotted(self):
+        answer = Answer(text="Hi")
+        with pytest.raises(FrozenInstanceError):
+            answer.text = "Bye"
+        assert not hasattr(answer, "__dict__")
+
+    def test_payload_cache_is_not_a_field(self):
+        answer = Answer(text="Hi")
+        answer.to_dict()
+        assert "_payload" not in {f.name for f in fields(answer)}
+        assert "_payload" not in asdict(answer)
+
+    def test_non_slotted_frozen_subclass(self):
+        @dataclass(frozen=True)
+        class Greeting(Answer):
+            name: str = "world"
+
+        answer = Greeting(text="Hello")
+        assert answer.to_dict()["text"] == "Hello"
+        assert answer.to_dict() == answer.to_dict()
+        assert answer.type == "greeting"
+
     def test_type_property(self):
         assert Answer(text="").type == "answer"
         assert EditAnswer(text="").type == "editanswer"
@@ -249,7 +289,7 @@ class TestPollAnswer:
     def test_poll_answer_creation(self):
         answer = PollAnswer(question="Q?", options=["A", "B"], text="")
         assert answer.question == "Q?"
-        assert answer.options == ["A", "B"]
+        assert answer.options == ("A", "B")
         assert answer.type == "regular"
 
     def test_to_dict(self):
@@ -258,11 +298,21 @@ class TestPollAnswer:
         )
         d = answer.to_dict()
         assert d["question"] == "Q?"
-        assert d["options"] == ["A", "B"]
+        assert d["options"] == ("A", "B")
         assert d["is_anonymous"] is False
         assert d["type"] == "regular"
         assert "explanation" not in d
 
+    def test_subclass_keeps_type_field(self):
+        @dataclass(slots=True, frozen=True)
+        class MyPoll(PollAnswer):
+            pass
+
+        answer = MyPoll(question="Q?", options=["A", "B"], text="", type="quiz")
+        assert answer.type == "quiz"
+        assert answer.to_dict()["type"] == "quiz"
+        assert MyPoll(question="Q?", options=["A"], text="").type == "regular"
+
 
 class TestDiceAnswer:
     """Tests for DiceAnswer."""
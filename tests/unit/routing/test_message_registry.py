@@ -1,4 +1,7 @@
+import pytest
+from dataclasses import FrozenInstanceError
 from botty.routing import MessageRegistry
+from botty.routing.registry import MessageRecord
 import time
 from botty.testing import TestMessageRegistry
 from datetime import datetime
@@ -118,7 +121,8 @@ class TestMessageRegistryLocal:
         # Limit
         limited = registry.get_by_handler("a", limit=2)
         assert len(limited) == 2
-        # Should be most recent first, but since we didn't vary dates, order not important
+        # Most recently registered first, even with equal dates
+        assert [(r.chat_id, r.message_id) for r in limited] == [(2, 1), (2, 0)]
 
     def test_get_by_key_nonexistent(self, message_registry):
         """get_by_key returns None for unknown key."""
@@ -258,3 +262,40 @@ class TestMessageRegistryLocal:
 
         # "lonely" handler should be gone
         assert "lonely" not in message_registry._handler_registry
+
+    def test_cleanup_keeps_keys_of_other_chats_and_later_records(
+        self, message_registry
+    ):
+        """Eviction only drops keys that still point at the evicted record."""
+        other = Message(message_id=1, chat_id=2, date=datetime.now())
+        r_other = message_registry.register_message(other, key="other")
+
+        # Same message registered twice (e.g. after an edit), key moves on
+        msg = Message(message_id=1, chat_id=1, date=datetime.now())
+        message_registry.register_message(msg, key="k")
+        r_edited = message_registry.register_message(msg, key="k")
+
+        # Evict the first registration of message 1 in chat 1
+        for message_id in (2, 3):
+            message_registry.register_message(
+                Message(message_id=message_id, chat_id=1, date=datetime.now())
+            )
+
+        assert message_registry.get_by_key("k") is r_edited
+        assert message_registry.get_by_key("other") is r_other
+
+    def test_records_are_immutable(self, message_registry, sample_message):
+        record = message_registry.register_message(sample_message)
+
+        with pytest.raises(FrozenInstanceError):
+            record.handler_name = "other"  # type: ignore[misc]
+        assert not hasattr(record, "__dict__")
+
+    def test_record_age_counts_from_message_date(self):
+        record = MessageRecord(
+            message_id=1, chat_id=1, handler_name="h", timestamp=time.time() - 10
+        )
+
+        assert 10 <= record.age < 11
+        assert record.is_older_than(9)
+        assert not record.is_older_than(11)
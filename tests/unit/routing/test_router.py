@@ -1,9 +1,10 @@
 # tests/unit/routing/test_router.py
+import asyncio
 from typing import Annotated, AsyncGenerator
 from unittest.mock import Mock, patch
 
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, select
 from telegram.ext import (
     CallbackQueryHandler,
     CommandHandler,
@@ -103,14 +104,18 @@ class TestRouterRegistration:
         assert callable(router.handlers[0][2])
 
     def test_command_decorator_multiple(self, router):
-        @router.command(["help", "info"])
+        commands = ["help", "info"]
+
+        @router.command(commands)
         async def handler(update: Update, context: Context):
             yield Answer(text="ok")
 
-        assert len(router.handlers) == 2
+        commands.append("later")
+
+        assert len(router.handlers) == 1
         assert router.handlers[0][0] == "command"
-        assert router.handlers[0][1] == "help"
-        assert router.handlers[1][1] == "info"
+        assert router.handlers[0][1] == ("help", "info")
+        assert router.get_handlers()[0].commands == frozenset({"help", "info"})
 
     def test_callback_query_decorator(self, router):
         @router.callback_query(r"^data_\d+")
@@ -119,7 +124,18 @@ class TestRouterRegistration:
 
         assert len(router.handlers) == 1
         assert router.handlers[0][0] == "callback_query"
-        assert router.handlers[0][1] == r"^data_\d+"
+        assert router.handlers[0][1].pattern == r"^data_\d+"
+
+    def test_equal_patterns_share_compiled_regex(self, router):
+        @router.callback_query("^same")
+        async def first(update: Update, context: Context):
+            yield Answer(text="ok")
+
+        @router.callback_query("^same")
+        async def second(update: Update, context: Context):
+            yield Answer(text="ok")
+
+        assert router.handlers[0][1] is router.handlers[1][1]
 
     def test_message_decorator(self, router):
         @router.message(filters.TEXT)
@@ -137,7 +153,7 @@ class TestRouterRegistration:
 
         assert len(router.handlers) == 1
         assert router.handlers[0][0] == "inline_query"
-        assert router.handlers[0][1] == "^query"
+        assert router.handlers[0][1].pattern == "^query"
 
     def test_prefix_decorator_single(self, router):
         @router.prefix("!", "help")
@@ -154,10 +170,10 @@ class TestRouterRegistration:
         async def handler(update: Update, context: Context):
             yield Answer(text="ok")
 
-        assert len(router.handlers) == 2
+        assert len(router.handlers) == 1
         assert router.handlers[0][1] == "!"
-        assert router.handlers[0][2] == "help"
-        assert router.handlers[1][2] == "info"
+        assert router.handlers[0][2] == ("help", "info")
+        assert router.get_handlers()[0].commands == frozenset({"!help", "!info"})
 
     def test_get_handlers_returns_ptb_objects(self, router):
         @router.command("start")
@@ -189,6 +205,16 @@ class TestRouterRegistration:
         assert isinstance(ptb_handlers[3], InlineQueryHandler)
         assert isinstance(ptb_handlers[4], PrefixHandler)
 
+    def test_get_handlers_reflects_handlers_list(self, router):
+        @router.command("start")
+        async def cmd(update: Update, context: Context):
+            yield Answer(text="ok")
+
+        router.handlers.append(("command", "extra", router.handlers[0][2]))
+
+        commands = [h.commands for h in router.get_handlers()]
+        assert commands == [frozenset({"start"}), frozenset({"extra"})]
+
 
 class TestHandlerExecution:
     """Test that the wrapper executes handlers correctly with all components."""
@@ -215,6 +241,59 @@ class TestHandlerExecution:
         assert records[0].handler_name == "handler"
         assert records[0].message_id == 1000
 
+    @pytest.mark.asyncio
+    async def test_resolver_and_processor_reused_across_updates(
+        self, router, ptb_update, test_context_with_doubles
+    ):
+        router.command("start")(simple_handler)
+
+        wrapper = router.handlers[0][2]
+        await wrapper(ptb_update, test_context_with_doubles)
+        resolver, processor = router._resolver, router._processor
+        await wrapper(ptb_update, test_context_with_doubles)
+
+        assert router._resolver is resolver
+        assert router._processor is processor
+        assert len(test_context_with_doubles.bot_data.bot_client.sent) == 2
+
+    @pytest.mark.asyncio
+    async def test_updates_from_one_chat_run_in_order(
+        self, router, ptb_update, test_context_with_doubles
+    ):
+        events: list[str] = []
+        release = asyncio.Event()
+
+        @router.command("slow")
+        async def handler(update: Update, context: Context):
+            events.append(f"start {len(events)}")
+            await release.wait()
+            events.append("end")
+            yield Answer(text="done")
+
+        wrapper = router.handlers[0][2]
+        first = asyncio.create_task(wrapper(ptb_update, test_context_with_doubles))
+        second = asyncio.create_task(wrapper(ptb_update, test_context_with_doubles))
+        await asyncio.sleep(0)
+        assert events == ["start 0"]
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert events == ["start 0", "end", "start 2", "end"]
+        assert not test_context_with_doubles.bot_data.chat_locks
+
+    @pytest.mark.asyncio
+    async def test_empty_answer_is_not_sent(
+        self, router, ptb_update, test_context_with_doubles
+    ):
+        router.command("empty")(empty_handler)
+
+        wrapper = router.handlers[0][2]
+        await wrapper(ptb_update, test_context_with_doubles)
+
+        assert test_context_with_doubles.bot_data.bot_client.sent == []
+        registry = test_context_with_doubles.bot_data.message_registry
+        assert registry.get_all_records() == []
+
     @pytest.mark.asyncio
     async def test_multi_answer_handler_sends_multiple_messages(
         self, router, ptb_update, test_context_with_doubles
@@ -374,6 +453,22 @@ class TestErrorHandling:
 
         # Exception propagates, no log capture needed
 
+    @pytest.mark.asyncio
+    async def test_handler_exception_after_query_propagates(
+        self, router, ptb_update, test_context_with_doubles
+    ):
+        # A real in-memory SQLite session is bound to the event loop thread,
+        # so closing it must happen there as well.
+        @router.command("fail")
+        async def handler(update: Update, context: Context, session: Session):
+            session.exec(select(1)).one()
+            raise ValueError("boom")
+            yield  # pragma: no cover
+
+        wrapper = router.handlers[0][2]
+        with pytest.raises(ValueError, match="boom"):
+            await wrapper(ptb_update, test_context_with_doubles)
+
     @pytest.mark.asyncio
     async def test_response_processor_handles_send_failure(
         self, router, ptb_update, test_context_with_doubles, caplog